@@ -8,9 +8,18 @@ import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import Counter
+from collections import Counter, OrderedDict
 import json
 import hashlib
+import string
+
+# NumPy accelerates batch threshold filtering (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 # Import base classes from the architecture
 import sys
@@ -26,6 +35,7 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
@@ -34,6 +44,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Fixed int8 scale for quantized scores in [0, 1]
+QUANT_SCALE = 127
+
+# Maps punctuation to spaces when normalizing text for the category cache
+_PUNCT_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
 @dataclass
 class QualityMetrics:
     """Content quality assessment metrics"""
@@ -83,7 +99,7 @@ class CuratorAgent(BaseAgent):
         
         # Configuration
         self.quality_threshold = config.get("quality_threshold", 0.6)
-        self.relevance_threshold = config.get("relevance_threshold", 0.4)
+        self.relevance_threshold = config.get("relevance_threshold", config.get("ai_relevance_threshold", 0.4))
         self.content_categories = config.get("content_categories", self._default_categories())
         self.trend_analysis_days = config.get("trend_analysis_days", 7)
         
@@ -92,6 +108,10 @@ class CuratorAgent(BaseAgent):
         self.content_trends: Dict[str, Any] = {}
         self.category_stats: Dict[str, int] = {}
         
+        # Bounded LRU cache of categories keyed on normalized title/body hashes
+        self.category_cache_size = config.get("category_cache_size", 8192)
+        self._category_cache: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
+        
         # AI/AEC keyword databases
         self.ai_keywords = self._initialize_ai_keywords()
         self.aec_keywords = self._initialize_aec_keywords()
@@ -108,6 +128,7 @@ class CuratorAgent(BaseAgent):
         - "detect_trends": Identify trending topics
         - "filter_quality": Remove low-quality content
         - "get_curated_content": Get curated content for newsletter
+        - "get_curation_metrics": Report analyzed and curated item counts
         """
         try:
             self.status = AgentStatus.WORKING
@@ -125,6 +146,8 @@ class CuratorAgent(BaseAgent):
                 return await self._get_curated_content(task.data)
             elif task_type == "categorize_content":
                 return await self._categorize_content(task.data.get("content_items", []))
+            elif task_type == "get_curation_metrics":
+                return await self._get_curation_metrics(task.data.get("since"))
             else:
                 return {"status": "error", "message": f"Unknown task type: {task_type}"}
                 
@@ -510,10 +533,28 @@ class CuratorAgent(BaseAgent):
     
     def _categorize_single_item(self, content_item: ContentItem) -> str:
         """
-        Categorize a single content item
+        Categorize a single content item, reusing results for near-duplicate text
         """
-        content = (content_item.content + " " + content_item.title).lower()
+        title = " ".join(content_item.title.lower().translate(_PUNCT_TABLE).split())
+        body = " ".join(content_item.content.lower().translate(_PUNCT_TABLE).split())
+        key = (hash(title), hash(body))
         
+        category = self._category_cache.get(key)
+        if category is not None:
+            self._category_cache.move_to_end(key)
+            return category
+        
+        category = self._classify_text(body + " " + title)
+        self._category_cache[key] = category
+        if len(self._category_cache) > self.category_cache_size:
+            self._category_cache.popitem(last=False)
+        
+        return category
+    
+    def _classify_text(self, content: str) -> str:
+        """
+        Keyword-based category classification of normalized text
+        """
         category_keywords = {
             "BIM & Digital Twins": ['bim', 'digital twin', 'revit', 'modeling', '3d', 'cad'],
             "Construction Automation": ['automation', 'robotics', 'machinery', 'equipment', 'automated'],
@@ -772,21 +813,12 @@ class CuratorAgent(BaseAgent):
                 return analysis_result
             
             # Filter by quality and relevance thresholds
-            high_quality = []
-            medium_quality = []
-            low_quality = []
+            analysis_results = analysis_result["analysis_results"]
+            high_idx, medium_idx, low_idx = self._partition_by_thresholds(analysis_results)
             
-            for analysis_data in analysis_result["analysis_results"]:
-                quality_score = analysis_data["quality_metrics"]["overall_quality"]
-                relevance_score = analysis_data["ai_relevance"]["overall_relevance"]
-                
-                if (quality_score >= self.quality_threshold and 
-                    relevance_score >= self.relevance_threshold):
-                    high_quality.append(analysis_data)
-                elif quality_score >= 0.4 or relevance_score >= 0.3:
-                    medium_quality.append(analysis_data)
-                else:
-                    low_quality.append(analysis_data)
+            high_quality = [analysis_results[i] for i in high_idx]
+            medium_quality = [analysis_results[i] for i in medium_idx]
+            low_quality = [analysis_results[i] for i in low_idx]
             
             return {
                 "status": "success",
@@ -811,6 +843,76 @@ class CuratorAgent(BaseAgent):
             logger.error(f"Error filtering content by quality: {e}")
             return {"status": "error", "message": str(e)}
     
+    def _to_soa(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Materialize the quality and relevance scores of a batch as columnar arrays
+        """
+        return {
+            "quality": np.fromiter(
+                (a["quality_metrics"]["overall_quality"] for a in analyses),
+                dtype=np.float64, count=len(analyses)
+            ),
+            "relevance": np.fromiter(
+                (a["ai_relevance"]["overall_relevance"] for a in analyses),
+                dtype=np.float64, count=len(analyses)
+            )
+        }
+    
+    def _quantize(self, scores: "np.ndarray") -> "np.ndarray":
+        """
+        Quantize [0, 1] scores to int8 by truncation
+        """
+        return np.clip(scores * QUANT_SCALE, -128, 127).astype(np.int8)
+    
+    def _at_least(self, scores: "np.ndarray", codes: "np.ndarray", threshold: float) -> "np.ndarray":
+        """
+        Mask of scores >= threshold, settled from the int8 codes except for
+        items in the threshold's own quantization step, which are re-checked
+        against the exact scores so the result matches the plain float loop
+        """
+        step = int(threshold * QUANT_SCALE)
+        passed = codes > step
+        near = codes == step
+        passed[near] = scores[near] >= threshold
+        return passed
+    
+    def _partition_by_thresholds(self, analyses: List[Dict[str, Any]]) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Split analysis results into high/medium/low tiers, returning indices
+        """
+        if NUMPY_AVAILABLE and analyses:
+            columns = self._to_soa(analyses)
+            q = self._quantize(columns["quality"])
+            r = self._quantize(columns["relevance"])
+            
+            quality, relevance = columns["quality"], columns["relevance"]
+            
+            high = (self._at_least(quality, q, self.quality_threshold)
+                    & self._at_least(relevance, r, self.relevance_threshold))
+            medium = ~high & (self._at_least(quality, q, 0.4) | self._at_least(relevance, r, 0.3))
+            low = ~(high | medium)
+            
+            return (
+                np.flatnonzero(high).tolist(),
+                np.flatnonzero(medium).tolist(),
+                np.flatnonzero(low).tolist()
+            )
+        
+        high_idx, medium_idx, low_idx = [], [], []
+        for i, analysis_data in enumerate(analyses):
+            quality_score = analysis_data["quality_metrics"]["overall_quality"]
+            relevance_score = analysis_data["ai_relevance"]["overall_relevance"]
+            
+            if (quality_score >= self.quality_threshold and 
+                relevance_score >= self.relevance_threshold):
+                high_idx.append(i)
+            elif quality_score >= 0.4 or relevance_score >= 0.3:
+                medium_idx.append(i)
+            else:
+                low_idx.append(i)
+        
+        return high_idx, medium_idx, low_idx
+    
     async def _get_curated_content(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get curated content for newsletter or other purposes
@@ -867,6 +969,34 @@ class CuratorAgent(BaseAgent):
             logger.error(f"Error getting curated content: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def _get_curation_metrics(self, since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Count analyzed items and those curated (at or above the quality threshold) after since
+        """
+        try:
+            recent = [
+                analysis for analysis in self.analyzed_content
+                if since is None or analysis.analysis_timestamp > since
+            ]
+            curated = sum(
+                1 for analysis in recent
+                if analysis.quality_metrics.overall_quality >= self.quality_threshold
+            )
+            
+            return {
+                "status": "success",
+                "metrics": {
+                    "total_analyzed": len(self.analyzed_content),
+                    "analyzed_since": len(recent),
+                    "curated_backlog": curated,
+                    "quality_threshold": self.quality_threshold
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting curation metrics: {e}")
+            return {"status": "error", "message": str(e)}
+    
     async def _categorize_content(self, content_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Categorize content items
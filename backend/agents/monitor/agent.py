@@ -43,6 +43,7 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
@@ -181,6 +182,11 @@ class MonitorAgent(BaseAgent):
                 "business": {}
             }
             
+            # Take one snapshot per probe so fields are consistent and not re-read
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+            network = psutil.net_io_counters()
+            
             # System metrics
             metrics["system"] = {
                 "cpu": {
@@ -189,22 +195,22 @@ class MonitorAgent(BaseAgent):
                     "core_count": psutil.cpu_count()
                 },
                 "memory": {
-                    "total": psutil.virtual_memory().total,
-                    "available": psutil.virtual_memory().available,
-                    "used": psutil.virtual_memory().used,
-                    "percent": psutil.virtual_memory().percent
+                    "total": memory.total,
+                    "available": memory.available,
+                    "used": memory.used,
+                    "percent": memory.percent
                 },
                 "disk": {
-                    "total": psutil.disk_usage('/').total,
-                    "free": psutil.disk_usage('/').free,
-                    "used": psutil.disk_usage('/').used,
-                    "percent": psutil.disk_usage('/').percent
+                    "total": disk.total,
+                    "free": disk.free,
+                    "used": disk.used,
+                    "percent": disk.percent
                 },
                 "network": {
-                    "bytes_sent": psutil.net_io_counters().bytes_sent,
-                    "bytes_recv": psutil.net_io_counters().bytes_recv,
-                    "packets_sent": psutil.net_io_counters().packets_sent,
-                    "packets_recv": psutil.net_io_counters().packets_recv
+                    "bytes_sent": network.bytes_sent,
+                    "bytes_recv": network.bytes_recv,
+                    "packets_sent": network.packets_sent,
+                    "packets_recv": network.packets_recv
                 }
             }
             
@@ -26,6 +26,7 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
@@ -33,6 +34,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Content pipeline DAG: agent -> downstream agents that consume its output
+PIPELINE_SUCCESSORS = {
+    "scout": ["curator"],
+    "curator": ["writer"],
+    "writer": []
+}
+
+# Assumed service time (seconds) for agents with no measurements yet
+DEFAULT_SERVICE_TIME = 1.0
+
 class TaskPriority(Enum):
     """Task priority levels"""
     CRITICAL = 1
@@ -89,6 +100,7 @@ class OrchestratorAgent(BaseAgent):
         self.newsletter_schedule = config.get("newsletter_schedule", "0 9 * * 2,5")  # Cron format
         self.health_check_interval = config.get("health_check_interval", 5)  # minutes
         self.max_concurrent_tasks = config.get("max_concurrent_tasks", 10)
+        self.writer_min_batch_size = config.get("writer_min_batch_size", 25)  # Curated items per newsletter
         
         # Task management
         self.task_queue: List[ScheduledTask] = []
@@ -250,7 +262,15 @@ class OrchestratorAgent(BaseAgent):
             
             # Check if we have enough curated content for newsletter
             current_time = datetime.now()
-            if (self.last_newsletter is None or 
+            curated_backlog = await self._curated_backlog_size()
+            pipeline_status["curated_backlog"] = curated_backlog
+            
+            if curated_backlog is not None and curated_backlog < self.writer_min_batch_size:
+                pipeline_status["writer_status"] = "waiting_for_content"
+                pipeline_status["recommendations"].append(
+                    f"Holding newsletter until {self.writer_min_batch_size} curated items ({curated_backlog} ready)"
+                )
+            elif (self.last_newsletter is None or 
                 current_time - self.last_newsletter >= timedelta(days=2)):  # Bi-weekly
                 
                 writer_task = AgentTask(
@@ -287,6 +307,25 @@ class OrchestratorAgent(BaseAgent):
             logger.error(f"Error coordinating pipeline: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def _curated_backlog_size(self) -> Optional[int]:
+        """
+        Ask the Curator how many items it curated since the last newsletter, or None if unavailable
+        """
+        curator = self.registered_agents.get("curator")
+        if curator is None:
+            return None
+        
+        result = await curator.process_task(AgentTask(
+            task_id=f"curation-metrics-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+            agent_type="curator",
+            priority=5,
+            data={"type": "get_curation_metrics", "since": self.last_newsletter},
+            created_at=datetime.now()
+        ))
+        if result.get("status") != "success":
+            return None
+        return result["metrics"]["curated_backlog"]
+    
     async def _handle_agent_error(self, error_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle agent errors and implement recovery strategies
@@ -485,10 +524,12 @@ class OrchestratorAgent(BaseAgent):
             try:
                 current_time = datetime.now()
                 
-                # Process due tasks
+                # Collect due tasks
+                due_tasks = []
                 while self.task_queue and self.task_queue[0].scheduled_time <= current_time:
-                    scheduled_task = heapq.heappop(self.task_queue)
-                    
+                    due_tasks.append(heapq.heappop(self.task_queue))
+                
+                for scheduled_task in self._order_due_tasks(due_tasks):
                     # Execute task asynchronously
                     asyncio.create_task(self._execute_task(scheduled_task))
                 
@@ -503,6 +544,28 @@ class OrchestratorAgent(BaseAgent):
                 logger.error(f"Scheduler loop error: {e}")
                 await asyncio.sleep(60)  # Wait longer on error
     
+    def _order_due_tasks(self, due_tasks: List[ScheduledTask]) -> List[ScheduledTask]:
+        """
+        Start longest-critical-path work first; static priority breaks ties
+        """
+        ranks: Dict[str, float] = {}
+        return sorted(due_tasks, key=lambda t: (-self._critical_path_rank(t.agent_target, ranks), t))
+    
+    def _critical_path_rank(self, agent_target: str, ranks: Dict[str, float]) -> float:
+        """
+        Measured service time of agent_target plus its longest downstream path.
+        ranks memoizes results for one scheduling round.
+        """
+        if agent_target in ranks:
+            return ranks[agent_target]
+        
+        health = self.agent_health.get(agent_target)
+        service_time = health.average_response_time if health and health.average_response_time else DEFAULT_SERVICE_TIME
+        
+        downstream = [self._critical_path_rank(u, ranks) for u in PIPELINE_SUCCESSORS.get(agent_target, [])]
+        ranks[agent_target] = service_time + max(downstream, default=0.0)
+        return ranks[agent_target]
+    
     async def _execute_task(self, scheduled_task: ScheduledTask):
         """
         Execute a scheduled task
@@ -5,6 +5,7 @@ Enhanced scraping capabilities for protected sites and search functionality
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 import json
 import time
 from datetime import datetime, timedelta
@@ -58,6 +59,7 @@ class AdvancedScraper:
         self.retry_delay = config.get("retry_delay", 5.0)
         self.request_timeout = config.get("request_timeout", 30.0)
         self.enable_search = config.get("enable_search", True)
+        self.http_client = config.get("http_client")  # Shared client for search APIs (optional)
         
         # User agent rotation
         self.user_agents = [
@@ -102,6 +104,17 @@ class AdvancedScraper:
             )
             self.scraping_sessions.append(session)
     
+    @asynccontextmanager
+    async def _api_client(self):
+        """
+        Yield the shared HTTP client if configured, otherwise a short-lived one
+        """
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+    
     def _get_next_session(self) -> ScrapingSession:
         """Get next available scraping session with rotation"""
         # Filter out blocked sessions
@@ -445,7 +458,7 @@ class AdvancedScraper:
                 "textFormat": "Raw"
             }
             
-            async with httpx.AsyncClient() as client:
+            async with self._api_client() as client:
                 response = await client.get(
                     "https://api.bing.microsoft.com/v7.0/search",
                     headers=headers,
@@ -488,7 +501,7 @@ class AdvancedScraper:
                 "safe": "off"
             }
             
-            async with httpx.AsyncClient() as client:
+            async with self._api_client() as client:
                 response = await client.get(
                     "https://www.googleapis.com/customsearch/v1",
                     params=params,
@@ -531,7 +544,7 @@ class AdvancedScraper:
                 "gl": "us"
             }
             
-            async with httpx.AsyncClient() as client:
+            async with self._api_client() as client:
                 response = await client.get(
                     "https://serpapi.com/search",
                     params=params,
@@ -570,7 +583,7 @@ class AdvancedScraper:
                 "skip_disambig": "1"
             }
             
-            async with httpx.AsyncClient() as client:
+            async with self._api_client() as client:
                 response = await client.get(
                     "https://api.duckduckgo.com/",
                     params=params,
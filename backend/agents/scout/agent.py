@@ -4,12 +4,20 @@ Handles RSS/feed monitoring, web scraping, and content deduplication
 """
 
 import asyncio
+import calendar
 import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import IO, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import json
+import re
+import tempfile
+from xml.parsers import expat
 
 import httpx
 from bs4 import BeautifulSoup
@@ -31,14 +39,58 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
     ContentItem = arch_module.ContentItem
     AgentStatus = arch_module.AgentStatus
 
+# Optional Bloom filter for persistent URL dedup across polls
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+# Optional dateutil for pubDate strings feedparser could not parse itself
+try:
+    from dateutil import parser as du_parser
+    from dateutil.tz import tzoffset
+    DATEUTIL_AVAILABLE = True
+except ImportError:
+    DATEUTIL_AVAILABLE = False
+
+# Optional lxml for a C-backed fast path over plain RSS/Atom feeds
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Timezone abbreviations seen in RSS pubDates, resolved once rather than on every entry
+TZINFOS = {
+    name: tzoffset(name, hours * 3600)
+    for name, hours in (
+        ("EST", -5), ("EDT", -4), ("CST", -6), ("CDT", -5),
+        ("MST", -7), ("MDT", -6), ("PST", -8), ("PDT", -7),
+        ("BST", 1), ("CET", 1), ("CEST", 2), ("JST", 9), ("AEST", 10)
+    )
+} if DATEUTIL_AVAILABLE else {}
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/rss+xml, application/xml, text/xml, text/html, application/xhtml+xml, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
 @dataclass
 class SourceMetrics:
     """Track performance metrics for each RSS source"""
@@ -54,6 +106,283 @@ class SourceMetrics:
     is_active: bool = True
     last_error: Optional[str] = None
 
+# Bytes inspected to tell JSON Feed, HTML error pages and XML feeds apart
+FEED_SNIFF_BYTES = 512
+_FIRST_TAG = re.compile(rb"<([A-Za-z][\w:.-]*)")
+# Comments, processing instructions and the DOCTYPE that may precede the root element
+_PROLOG = re.compile(rb"<!--.*?-->|<\?.*?\?>|<!DOCTYPE[^>]*>", re.DOTALL | re.IGNORECASE)
+
+def sniff_feed_type(head: bytes) -> str:
+    """
+    Classify a feed body as "json", "html" or "xml" from its first bytes
+    """
+    head = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if head.startswith(b"{"):
+        return "json"
+    head = _PROLOG.sub(b"", head)
+    # A comment or PI still open at the end of the sniffed bytes hides the rest
+    head = re.split(rb"<!--|<\?", head, maxsplit=1)[0]
+    match = _FIRST_TAG.search(head)
+    if match and match.group(1).lower() == b"html":
+        return "html"
+    return "xml"
+
+def parse_json_feed(body: IO[bytes]) -> feedparser.FeedParserDict:
+    """
+    Parse a JSON Feed (jsonfeed.org) into the shape feedparser.parse returns
+    """
+    data = json.load(body)
+    entries = [
+        feedparser.FeedParserDict(
+            id=item.get("id", ""),
+            link=item.get("url") or item.get("external_url", ""),
+            title=item.get("title", ""),
+            summary=item.get("summary") or item.get("content_text") or item.get("content_html", ""),
+            published=item.get("date_published", "")
+        )
+        for item in data.get("items", [])
+    ]
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(title=data.get("title", "")),
+        entries=entries,
+        bozo=False,
+        bozo_exception=None
+    )
+
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+def _own_tag(element, name: str) -> str:
+    """
+    name qualified with element's own namespace, so RSS/Atom children win over itunes:/media: ones
+    """
+    namespace = etree.QName(element).namespace
+    return f"{{{namespace}}}{name}" if namespace else name
+
+def _child_text(element, *names: str) -> str:
+    """
+    Stripped text of the first non-empty child with one of the names; bare
+    names are looked up in element's own namespace
+    """
+    for name in names:
+        child = element.find(name if name.startswith("{") else _own_tag(element, name))
+        if child is not None and child.text:
+            return child.text.strip()
+    return ""
+
+def plain_text(text: str) -> str:
+    """
+    Strip HTML markup from feed text, so every parser path yields the same summaries
+    """
+    if "<" not in text and "&" not in text:
+        return text.strip()
+    if LXML_AVAILABLE:
+        try:
+            fragment = lxml_html.fragment_fromstring(text, create_parent="div")
+        except (etree.ParserError, ValueError):
+            return text.strip()
+        for element in fragment.xpath(".//script|.//style"):
+            element.drop_tree()
+        return fragment.text_content().strip()
+    soup = BeautifulSoup(text, "html.parser")
+    for element in soup(["script", "style"]):
+        element.decompose()
+    return soup.get_text().strip()
+
+def _entry_link(element) -> str:
+    """
+    RSS <link>text</link>, or the href of an Atom alternate link
+    """
+    for link in element.iterfind(_own_tag(element, "link")):
+        if link.get("href") and link.get("rel", "alternate") == "alternate":
+            return link.get("href")
+        if link.text and link.text.strip():
+            return link.text.strip()
+    return ""
+
+def parse_xml_feed_lxml(body: IO[bytes]) -> feedparser.FeedParserDict:
+    """
+    Parse an RSS/Atom feed with lxml into the shape feedparser.parse returns
+    
+    Only the fields the Scout reads are extracted, and dates are left as
+    strings for dateutil.
+    Raises when lxml cannot recover a document.
+    """
+    parser = etree.XMLParser(recover=True, huge_tree=False, resolve_entities=False, no_network=True)
+    root = etree.parse(body, parser).getroot()
+    if root is None:
+        raise ValueError("No XML document found")
+    channel = root.find("{*}channel")
+    entries = [
+        feedparser.FeedParserDict(
+            id=_child_text(item, "guid", "id"),
+            link=_entry_link(item),
+            title=_child_text(item, "title"),
+            summary=_child_text(item, "description", "summary", "content"),
+            published=_child_text(item, "pubDate", "published", "updated", DC_DATE)
+        )
+        for item in root.iter("{*}item", "{*}entry")
+    ]
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(
+            title=_child_text(channel if channel is not None else root, "title")
+        ),
+        entries=entries,
+        bozo=False,
+        bozo_exception=None
+    )
+
+class FeedItemTracker:
+    """
+    Follows a feed's XML as it streams in and spots where its first N items end
+    """
+    
+    ITEM_TAGS = {"item", "entry"}
+    
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.items_seen = 0
+        self.open_tags: List[str] = []
+        self.item_end: Optional[int] = None  # byte offset of the Nth closing item tag
+        self.failed = False
+        
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Feed the next chunk; returns True once max_items items have closed
+        """
+        if self.item_end is None and not self.failed:
+            try:
+                self._parser.Parse(chunk, False)
+            except expat.ExpatError:
+                # Not well-formed XML, so let feedparser handle the whole body
+                self.failed = True
+        return self.item_end is not None
+    
+    def closing_tags(self) -> bytes:
+        """
+        End tags that close the elements still open at the cut point
+        """
+        return b"".join(b"</" + tag.encode("utf-8") + b">" for tag in reversed(self.open_tags))
+    
+    def _start_element(self, name, attrs):
+        if self.item_end is None:
+            self.open_tags.append(name)
+    
+    def _end_element(self, name):
+        if self.item_end is not None:
+            return
+        self.open_tags.pop()
+        if name.rsplit(":", 1)[-1] in self.ITEM_TAGS:
+            self.items_seen += 1
+            if self.items_seen >= self.max_items:
+                self.item_end = self._parser.CurrentByteIndex
+
+class AdaptiveLimiter:
+    """
+    Vegas-style concurrency limit for outbound requests
+    
+    The limit grows while request latency stays close to the best seen and
+    shrinks as latency climbs (requests queueing at the server). Timeouts,
+    429s and 5xx responses halve it, and the slot is held for backoff_delay
+    before being released.
+    """
+    
+    def __init__(self, min_limit: int, max_limit: int, backoff_delay: float = 0.0,
+                 alpha: int = 3, beta: int = 6):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = self.min_limit
+        self.backoff_delay = backoff_delay
+        self.alpha = alpha
+        self.beta = beta
+        self.in_flight = 0
+        self.min_latency: Optional[float] = None
+        self._slot_freed: Optional[asyncio.Condition] = None  # created on first use, inside the running loop
+    
+    @asynccontextmanager
+    async def use(self):
+        """
+        Hold a request slot for the duration of the block and learn from its latency
+        """
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Condition()
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        
+        started = time.perf_counter()
+        overloaded = False
+        try:
+            yield
+        except httpx.TimeoutException:
+            overloaded = True
+            raise
+        except httpx.HTTPStatusError as e:
+            overloaded = e.response.status_code == 429 or e.response.status_code >= 500
+            raise
+        finally:
+            try:
+                if overloaded:
+                    self.limit = max(self.min_limit, self.limit // 2)
+                    await asyncio.sleep(self.backoff_delay)
+                else:
+                    self._observe(time.perf_counter() - started)
+            finally:
+                # Shielded so a cancellation during the backoff cannot leak the slot
+                await asyncio.shield(self._release())
+    
+    async def _release(self):
+        async with self._slot_freed:
+            self.in_flight -= 1
+            self._slot_freed.notify_all()
+    
+    def _observe(self, latency: float):
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        # Estimated requests queued at the server for the current limit
+        queued = self.limit * (1 - self.min_latency / latency) if latency > 0 else 0
+        if queued < self.alpha:
+            self.limit = min(self.max_limit, self.limit + 1)
+        elif queued > self.beta:
+            self.limit = max(self.min_limit, self.limit - 1)
+
+class SeenURLSet:
+    """
+    Bounded seen-URL set used when pybloom_live is not installed
+    
+    Keeps the most recent max_size URLs, evicting the oldest first, and
+    persists them as a JSON list through the same tofile/fromfile calls
+    as ScalableBloomFilter.
+    """
+    
+    def __init__(self, max_size: int, urls: Optional[List[str]] = None):
+        self.max_size = max(1, max_size)
+        self._urls: "OrderedDict[str, None]" = OrderedDict()
+        for url in urls or []:
+            self.add(url)
+    
+    def add(self, url: str):
+        self._urls[url] = None
+        self._urls.move_to_end(url)
+        while len(self._urls) > self.max_size:
+            self._urls.popitem(last=False)
+    
+    def __contains__(self, url) -> bool:
+        return url in self._urls
+    
+    def __len__(self) -> int:
+        return len(self._urls)
+    
+    def tofile(self, f: IO[bytes]):
+        f.write(json.dumps(list(self._urls)).encode("utf-8"))
+    
+    @classmethod
+    def fromfile(cls, f: IO[bytes], max_size: int) -> "SeenURLSet":
+        return cls(max_size, json.loads(f.read().decode("utf-8")))
+
 class ScoutAgent(BaseAgent):
     """
     Scout Agent Implementation
@@ -74,29 +403,46 @@ class ScoutAgent(BaseAgent):
         self.max_concurrent_scrapes = config.get("max_concurrent_scrapes", 5)
         self.max_articles_per_source = config.get("max_articles_per_source", 10)
         self.content_freshness_hours = config.get("content_freshness_hours", 48)
-        self.rate_limit_delay = config.get("rate_limit_delay", 2.0)  # seconds
-        
-        # HTTP client configuration
-        self.session = httpx.AsyncClient(
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, text/html, application/xhtml+xml, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1"
-            },
+        self.rate_limit_delay = config.get("rate_limit_delay", 2.0)  # seconds of backoff when a server pushes back
+        self.max_feed_bytes = config.get("max_feed_bytes", 5 * 1024 * 1024)
+        self.feed_spool_bytes = config.get("feed_spool_bytes", 512 * 1024)  # larger bodies spill to disk
+        
+        # HTTP client configuration; a client passed as "http_client" is shared and not closed here
+        shared_client = config.get("http_client")
+        self._owns_session = shared_client is None
+        self.session = shared_client or httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
             timeout=30.0,
             follow_redirects=True,
             limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
         )
         
+        # Outbound request concurrency adapts between max_concurrent_scrapes and max_adaptive_concurrency
+        self.limiter = AdaptiveLimiter(
+            min_limit=self.max_concurrent_scrapes,
+            max_limit=config.get("max_adaptive_concurrency", self.max_concurrent_scrapes * 4),
+            backoff_delay=self.rate_limit_delay
+        )
+        
+        # Feeds download concurrently but parse one at a time, bounding feedparser's peak memory
+        self._parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{agent_id}-parse")
+        
         # Content storage
         self.discovered_content: List[ContentItem] = []
-        self.content_hashes: set = set()  # For deduplication
+        self.content_hashes: set = set()  # BLAKE2b hex digests, for deduplication
         self.source_metrics: Dict[str, SourceMetrics] = {}
         
+        # Seen-URL filter; persisted between polls only when seen_urls_path is set
+        self.seen_urls_path = config.get("seen_urls_path")
+        self.seen_urls_flush_every = config.get("seen_urls_flush_every", 50)
+        self.seen_urls_max = config.get("seen_urls_max", 100000)  # cap for the set fallback
+        self.seen_urls = self._load_seen_urls()
+        self._unflushed_urls = 0
+        
+        # Per-feed HTTP validators {url: [etag, last_modified, body_hash]} for conditional GETs
+        self.feed_validators_path = config.get("feed_validators_path")
+        self.feed_validators: Dict[str, List[Optional[str]]] = self._load_feed_validators()
+        
         logger.info(f"ScoutAgent {agent_id} initialized with {len(self.rss_feeds)} RSS feeds")
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
@@ -140,6 +486,7 @@ class ScoutAgent(BaseAgent):
         results = {
             "status": "success",
             "feeds_processed": 0,
+            "feeds_cached": 0,
             "articles_discovered": 0,
             "new_articles": 0,
             "duplicates_filtered": 0,
@@ -147,15 +494,8 @@ class ScoutAgent(BaseAgent):
             "articles": []
         }
         
-        # Limit concurrent processing
-        semaphore = asyncio.Semaphore(self.max_concurrent_scrapes)
-        
-        async def process_single_feed(feed_url: str) -> Dict[str, Any]:
-            async with semaphore:
-                return await self._process_rss_feed(feed_url)
-        
-        # Process feeds concurrently
-        feed_tasks = [process_single_feed(feed_url) for feed_url in feeds[:10]]  # Limit feeds
+        # Process feeds concurrently; the adaptive limiter bounds the requests in flight
+        feed_tasks = [self._process_rss_feed(feed_url) for feed_url in feeds[:10]]  # Limit feeds
         feed_results = await asyncio.gather(*feed_tasks, return_exceptions=True)
         
         # Aggregate results
@@ -170,6 +510,7 @@ class ScoutAgent(BaseAgent):
             
             if result.get("status") == "success":
                 results["feeds_processed"] += 1
+                results["feeds_cached"] += 1 if result.get("not_modified") else 0
                 results["articles_discovered"] += result.get("articles_found", 0)
                 results["new_articles"] += result.get("new_articles", 0)
                 results["duplicates_filtered"] += result.get("duplicates", 0)
@@ -198,11 +539,24 @@ class ScoutAgent(BaseAgent):
         
         try:
             # Fetch RSS feed
-            response = await self.session.get(feed_url)
-            response.raise_for_status()
+            body, validators = await self._fetch_feed_body(feed_url, self.max_articles_per_source)
+            if body is None:
+                self.feed_validators[feed_url] = validators
+                metrics.last_success = datetime.now()
+                return {
+                    "status": "success",
+                    "not_modified": True,
+                    "articles_found": 0,
+                    "new_articles": 0,
+                    "duplicates": 0,
+                    "articles": [],
+                    "response_time": (datetime.now() - start_time).total_seconds()
+                }
             
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
+            # Parse RSS feed off the event loop so other feeds keep downloading
+            loop = asyncio.get_event_loop()
+            with body:
+                feed = await loop.run_in_executor(self._parse_executor, self._parse_feed, body)
             
             if feed.bozo and feed.bozo_exception:
                 logger.warning(f"RSS parsing warning for {feed_url}: {feed.bozo_exception}")
@@ -214,9 +568,13 @@ class ScoutAgent(BaseAgent):
             # Process feed entries
             for entry in feed.entries[:self.max_articles_per_source]:
                 try:
+                    if getattr(entry, 'link', '') in self.seen_urls:
+                        duplicates += 1
+                        continue
+                    
                     article_data = await self._extract_article_from_entry(entry, feed_url)
                     
-                    if article_data and self._is_content_fresh(article_data):
+                    if article_data:
                         if self._is_duplicate(article_data):
                             duplicates += 1
                         else:
@@ -238,16 +596,17 @@ class ScoutAgent(BaseAgent):
                             # Add to discovered content and hash set
                             self.discovered_content.append(content_item)
                             self.content_hashes.add(article_data["content_hash"])
+                            self._remember_url(article_data["url"])
                             articles.append(asdict(content_item))
                             new_articles += 1
-                            
-                            # Rate limiting
-                            await asyncio.sleep(self.rate_limit_delay)
                 
                 except Exception as e:
                     logger.warning(f"Error processing entry from {feed_url}: {e}")
                     continue
             
+            # Only a fully processed feed may be skipped as unchanged next time
+            self.feed_validators[feed_url] = validators
+            
             # Update metrics
             response_time = (datetime.now() - start_time).total_seconds()
             metrics.last_success = datetime.now()
@@ -286,22 +645,100 @@ class ScoutAgent(BaseAgent):
                 "articles": []
             }
     
+    async def _fetch_feed_body(self, feed_url: str,
+                               max_items: Optional[int] = None) -> Tuple[Optional[IO[bytes]], List[Optional[str]]]:
+        """
+        Stream a feed body into a spooled temp file, stopping at max_feed_bytes
+        
+        Bodies up to feed_spool_bytes stay in memory; larger ones spill to disk.
+        With max_items set, the download stops once that many items have
+        arrived and the open elements are closed so the prefix stays well-formed.
+        Returns (body, validators). body is None when the feed is unchanged
+        since the last fetch, either via a 304 Not Modified or an identical
+        body hash; otherwise it is rewound and must be closed by the caller.
+        validators ([etag, last_modified, body_hash]) are not stored here;
+        the caller records them once the feed has been processed.
+        """
+        etag, last_modified, last_hash = self.feed_validators.get(feed_url, (None, None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        body = tempfile.SpooledTemporaryFile(max_size=self.feed_spool_bytes)
+        body_hash = hashlib.blake2b(digest_size=16)
+        size = 0
+        tracker = FeedItemTracker(max_items) if max_items else None
+        try:
+            async with self.limiter.use(), self.session.stream("GET", feed_url, headers=headers) as response:
+                if response.status_code == 304:
+                    body.close()
+                    return None, [etag, last_modified, last_hash]
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    body.write(chunk)
+                    body_hash.update(chunk)
+                    size += len(chunk)
+                    if tracker and tracker.feed(chunk):
+                        body.seek(tracker.item_end)
+                        cut = tracker.item_end + body.read().index(b">") + 1
+                        body.seek(cut)
+                        body.truncate()
+                        body.write(tracker.closing_tags())
+                        break
+                    if size >= self.max_feed_bytes:
+                        logger.warning(f"Feed {feed_url} exceeds {self.max_feed_bytes} bytes, truncating")
+                        break
+        except BaseException:
+            body.close()
+            raise
+        
+        digest = body_hash.hexdigest()
+        validators = [response.headers.get("ETag"), response.headers.get("Last-Modified"), digest]
+        if digest == last_hash:
+            body.close()
+            return None, validators
+        body.seek(0)
+        return body, validators
+    
+    def _parse_feed(self, body: IO[bytes]):
+        """
+        Sniff the feed format from its first bytes and hand it to the matching parser
+        """
+        feed_type = sniff_feed_type(body.read(FEED_SNIFF_BYTES))
+        body.seek(0)
+        if feed_type == "json":
+            return parse_json_feed(body)
+        if feed_type == "html":
+            raise ValueError("Response is an HTML page, not a feed")
+        # lxml fast path; dates it leaves as strings need dateutil
+        if LXML_AVAILABLE and DATEUTIL_AVAILABLE:
+            try:
+                feed = parse_xml_feed_lxml(body)
+                if feed.entries:
+                    return feed
+            except (etree.XMLSyntaxError, ValueError) as e:
+                logger.debug(f"lxml could not parse feed, falling back to feedparser: {e}")
+            body.seek(0)
+        return feedparser.parse(body)
+    
     async def _extract_article_from_entry(self, entry, feed_url: str) -> Optional[Dict[str, Any]]:
         """
         Extract article data from RSS entry
         """
         try:
-            # Basic article data
+            # Basic article data; feedparser leaves HTML in summaries, so reduce every parser's to text
             article_data = {
                 "url": getattr(entry, 'link', ''),
-                "title": getattr(entry, 'title', ''),
-                "summary": getattr(entry, 'summary', ''),
+                "title": plain_text(getattr(entry, 'title', '')),
+                "summary": plain_text(getattr(entry, 'summary', '')),
                 "published_date": self._parse_published_date(entry),
                 "source": feed_url
             }
             
-            # Skip if no URL
-            if not article_data["url"]:
+            # Skip if no URL, and skip stale entries before paying for the full-content fetch
+            if not article_data["url"] or not self._is_content_fresh(article_data):
                 return None
             
             # Try to extract full content
@@ -314,7 +751,7 @@ class ScoutAgent(BaseAgent):
             
             # Generate content hash for deduplication
             content_for_hash = f"{article_data['title']}{article_data['content']}"
-            article_data["content_hash"] = hashlib.md5(content_for_hash.encode()).hexdigest()
+            article_data["content_hash"] = self._content_hash(content_for_hash)
             
             return article_data
             
@@ -327,8 +764,9 @@ class ScoutAgent(BaseAgent):
         Extract full article content with bot protection bypass
         """
         try:
-            response = await self.session.get(url)
-            response.raise_for_status()
+            async with self.limiter.use():
+                response = await self.session.get(url)
+                response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -382,7 +820,7 @@ class ScoutAgent(BaseAgent):
                     "content": content,
                     "source": url,
                     "discovered_at": datetime.now(),
-                    "content_hash": hashlib.md5(content.encode()).hexdigest()
+                    "content_hash": self._content_hash(content)
                 }
                 
                 return {
@@ -425,36 +863,133 @@ class ScoutAgent(BaseAgent):
                 published_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
             except ValueError:
                 return True  # If date parsing fails, assume fresh
+        if published_date.tzinfo is not None:
+            published_date = published_date.astimezone(timezone.utc).replace(tzinfo=None)
         
-        cutoff_date = datetime.now() - timedelta(hours=self.content_freshness_hours)
+        # Published dates are naive UTC
+        cutoff_date = datetime.utcnow() - timedelta(hours=self.content_freshness_hours)
         return published_date >= cutoff_date
     
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        """
+        16-byte BLAKE2b digest as hex, the dedup key stored with every article
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    
     def _is_duplicate(self, article_data: Dict[str, Any]) -> bool:
         """
         Check if content is duplicate based on hash
         """
         return article_data.get("content_hash") in self.content_hashes
     
+    def _load_seen_urls(self):
+        """
+        Load the persisted seen-URL filter, or start an empty one
+        """
+        if self.seen_urls_path and os.path.exists(self.seen_urls_path):
+            try:
+                with open(self.seen_urls_path, "rb") as f:
+                    if BLOOM_AVAILABLE:
+                        return ScalableBloomFilter.fromfile(f)
+                    return SeenURLSet.fromfile(f, self.seen_urls_max)
+            except Exception as e:
+                logger.warning(f"Could not load seen URLs from {self.seen_urls_path}: {e}")
+        
+        if not BLOOM_AVAILABLE:
+            return SeenURLSet(self.seen_urls_max)
+        
+        return ScalableBloomFilter(
+            initial_capacity=10000,
+            error_rate=0.001,
+            mode=ScalableBloomFilter.SMALL_SET_GROWTH
+        )
+    
+    def _remember_url(self, url: str):
+        """
+        Mark URL as seen and flush the filter every N additions
+        """
+        if not url:
+            return
+        
+        self.seen_urls.add(url)
+        self._unflushed_urls += 1
+        
+        if self._unflushed_urls >= self.seen_urls_flush_every:
+            self._flush_seen_urls()
+    
+    def _flush_seen_urls(self):
+        """
+        Persist the seen-URL filter to disk
+        """
+        if not self.seen_urls_path or not self._unflushed_urls:
+            return
+        
+        try:
+            directory = os.path.dirname(self.seen_urls_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.seen_urls_path, "wb") as f:
+                self.seen_urls.tofile(f)
+            self._unflushed_urls = 0
+        except Exception as e:
+            logger.warning(f"Could not persist seen URLs to {self.seen_urls_path}: {e}")
+    
+    def _load_feed_validators(self) -> Dict[str, List[Optional[str]]]:
+        """
+        Load persisted feed validators, or start with none
+        """
+        if not self.feed_validators_path or not os.path.exists(self.feed_validators_path):
+            return {}
+        
+        try:
+            with open(self.feed_validators_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load feed validators from {self.feed_validators_path}: {e}")
+            return {}
+    
+    def _save_feed_validators(self):
+        """
+        Merge this agent's feed validators into the persisted file
+        """
+        if not self.feed_validators_path or not self.feed_validators:
+            return
+        
+        try:
+            directory = os.path.dirname(self.feed_validators_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Re-read first so agents sharing the file don't drop each other's feeds
+            validators = self._load_feed_validators()
+            validators.update(self.feed_validators)
+            with open(self.feed_validators_path, "w", encoding="utf-8") as f:
+                json.dump(validators, f)
+        except Exception as e:
+            logger.warning(f"Could not persist feed validators to {self.feed_validators_path}: {e}")
+    
     def _parse_published_date(self, entry) -> datetime:
         """
-        Parse published date from RSS entry
+        Parse published date from RSS entry as naive UTC
         """
         if hasattr(entry, 'published_parsed') and entry.published_parsed:
             try:
-                import time
-                return datetime.fromtimestamp(time.mktime(entry.published_parsed))
-            except (ValueError, TypeError):
+                # feedparser normalises published_parsed to UTC
+                return datetime.utcfromtimestamp(calendar.timegm(entry.published_parsed))
+            except (ValueError, TypeError, OverflowError):
                 pass
         
-        if hasattr(entry, 'published'):
+        if DATEUTIL_AVAILABLE and getattr(entry, 'published', None):
             try:
-                from dateutil import parser
-                return parser.parse(entry.published)
-            except (ValueError, ImportError):
+                published = du_parser.parse(entry.published, tzinfos=TZINFOS)
+                if published.tzinfo is not None:
+                    published = published.astimezone(timezone.utc).replace(tzinfo=None)
+                return published
+            except (ValueError, OverflowError):
                 pass
         
         # Fallback to current time
-        return datetime.now()
+        return datetime.utcnow()
     
     def _extract_domain_name(self, url: str) -> str:
         """
@@ -497,6 +1032,7 @@ class ScoutAgent(BaseAgent):
             "total_sources": len(self.source_metrics),
             "total_content_discovered": len(self.discovered_content),
             "unique_content_hashes": len(self.content_hashes),
+            "seen_urls": len(self.seen_urls),
             "source_metrics": metrics_data
         }
     
@@ -528,6 +1064,9 @@ class ScoutAgent(BaseAgent):
         """
         Cleanup resources
         """
-        if hasattr(self, 'session'):
+        self._flush_seen_urls()
+        self._save_feed_validators()
+        self._parse_executor.shutdown(wait=False)
+        if hasattr(self, 'session') and self._owns_session:
             await self.session.aclose()
         logger.info(f"ScoutAgent {self.agent_id} cleaned up")
\ No newline at end of file
@@ -85,7 +85,8 @@ class EnhancedScoutAgent(ScoutAgent):
                 "bing_api_key": config.get("bing_api_key"),
                 "google_api_key": config.get("google_api_key"),
                 "google_cse_id": config.get("google_cse_id"),
-                "serpapi_key": config.get("serpapi_key")
+                "serpapi_key": config.get("serpapi_key"),
+                "http_client": config.get("http_client")
             }
             self.advanced_scraper = AdvancedScraper(scraper_config)
         
@@ -372,8 +373,7 @@ class EnhancedScoutAgent(ScoutAgent):
                 "errors": []
             }
             
-            # RSS Discovery
-            if task_data.get("include_rss", True):
+            async def discover_rss():
                 try:
                     rss_result = await self._discover_from_rss(self.rss_feeds)
                     results["rss_results"] = rss_result
@@ -382,14 +382,15 @@ class EnhancedScoutAgent(ScoutAgent):
                 except Exception as e:
                     results["errors"].append(f"RSS discovery error: {str(e)}")
             
-            # Web Search
-            if task_data.get("include_search", True) and self.enable_search:
+            async def discover_search():
                 try:
                     search_queries = task_data.get("search_queries", self.search_queries)
                     all_search_results = []
                     
-                    for query in search_queries:
-                        search_result = await self._search_web_content(query, 5)
+                    search_results = await asyncio.gather(
+                        *(self._search_web_content(query, 5) for query in search_queries)
+                    )
+                    for search_result in search_results:
                         if search_result.get("status") == "success":
                             all_search_results.extend(search_result.get("enhanced_items", []))
                     
@@ -404,8 +405,7 @@ class EnhancedScoutAgent(ScoutAgent):
                 except Exception as e:
                     results["errors"].append(f"Web search error: {str(e)}")
             
-            # YouTube Discovery
-            if task_data.get("include_youtube", True) and self.enable_youtube:
+            async def discover_youtube():
                 try:
                     youtube_result = await self._search_youtube_content(self.youtube_search_limit)
                     results["youtube_results"] = youtube_result
@@ -414,6 +414,17 @@ class EnhancedScoutAgent(ScoutAgent):
                 except Exception as e:
                     results["errors"].append(f"YouTube discovery error: {str(e)}")
             
+            # Run the independent discovery methods concurrently
+            discoveries = []
+            if task_data.get("include_rss", True):
+                discoveries.append(discover_rss())
+            if task_data.get("include_search", True) and self.enable_search:
+                discoveries.append(discover_search())
+            if task_data.get("include_youtube", True) and self.enable_youtube:
+                discoveries.append(discover_youtube())
+            
+            await asyncio.gather(*discoveries)
+            
             logger.info(f"Comprehensive discovery completed: {results['total_content_found']} items from {len(results['discovery_methods'])} methods")
             
             return results
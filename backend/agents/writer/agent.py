@@ -3,8 +3,11 @@ Writer Agent - Newsletter Generation Implementation
 Handles Superhuman-style newsletter creation, content organization, and formatting
 """
 
+import hashlib
+import html
 import logging
 import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
@@ -24,6 +27,7 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
@@ -32,6 +36,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Sentinel placeholders for per-subscriber substitution. NUL bytes never occur
+# in rendered HTML, so a plain bytes.replace cannot hit newsletter content.
+NAME_TOKEN = b"\x00NAME\x00"
+UNSUB_TOKEN = b"\x00UNSUB\x00"
+
+@dataclass
+class Subscriber:
+    """Newsletter recipient used for personalization"""
+    email: str
+    name: str = ""
+    unsub_url: str = "#unsubscribe"
+
 @dataclass
 class NewsletterMetrics:
     """Newsletter performance metrics"""
@@ -95,6 +111,9 @@ class WriterAgent(BaseAgent):
         # Generated newsletters storage
         self.generated_newsletters: List[Newsletter] = []
         self.template_variations: Dict[str, str] = {}
+        self.shared_bodies: Dict[int, bytes] = {}  # issue_number -> UTF-8 body with sentinels
+        self.summary_cache_size = config.get("summary_cache_size", 50)
+        self._summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # items hash -> summary result, LRU
         
         # Content formatting rules
         self.formatting_rules = self._initialize_formatting_rules()
@@ -110,6 +129,7 @@ class WriterAgent(BaseAgent):
         - "create_summary": Generate executive summary only
         - "format_content": Apply formatting and structure
         - "test_subject_lines": A/B test subject lines
+        - "personalize_newsletter": Render per-subscriber HTML bodies
         """
         try:
             self.status = AgentStatus.WORKING
@@ -120,13 +140,15 @@ class WriterAgent(BaseAgent):
             if task_type == "generate_newsletter":
                 return await self._generate_complete_newsletter(task.data)
             elif task_type == "create_summary":
-                return await self._create_executive_summary(task.data.get("content_items", []))
+                return await self._get_executive_summary(task.data.get("content_items", []))
             elif task_type == "format_content":
                 return await self._format_newsletter_content(task.data)
             elif task_type == "test_subject_lines":
                 return await self._test_subject_lines(task.data)
             elif task_type == "get_newsletter_metrics":
                 return await self._get_newsletter_metrics()
+            elif task_type == "personalize_newsletter":
+                return await self._personalize_newsletter(task.data)
             else:
                 return {"status": "error", "message": f"Unknown task type: {task_type}"}
                 
@@ -157,8 +179,8 @@ class WriterAgent(BaseAgent):
             # Calculate newsletter metrics
             metrics = self._calculate_newsletter_metrics(content_items)
             
-            # Generate executive summary
-            summary_result = await self._create_executive_summary(content_items)
+            # Generate executive summary (cached for later create_summary lookups)
+            summary_result = await self._get_executive_summary(content_items)
             if summary_result.get("status") != "success":
                 return summary_result
             
@@ -190,6 +212,10 @@ class WriterAgent(BaseAgent):
             text_content = self._generate_text_newsletter(newsletter)
             newsletter.text_content = text_content
             
+            # Precompile the shared body once so per-subscriber sends are a bytes.replace
+            if self.personalization_enabled:
+                self.shared_bodies[issue_number] = self._render_shared_body(newsletter)
+            
             # Store newsletter
             self.generated_newsletters.append(newsletter)
             
@@ -209,6 +235,31 @@ class WriterAgent(BaseAgent):
             logger.error(f"Error generating newsletter: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def _get_executive_summary(self, content_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached executive summary for these items, generating it once
+        """
+        items_hash = self._items_hash(content_items)
+        cached = self._summary_cache.get(items_hash)
+        if cached is not None:
+            self._summary_cache.move_to_end(items_hash)
+            return cached
+        
+        summary_result = await self._create_executive_summary(content_items)
+        if summary_result.get("status") == "success":
+            self._summary_cache[items_hash] = summary_result
+            if len(self._summary_cache) > self.summary_cache_size:
+                self._summary_cache.popitem(last=False)
+        
+        return summary_result
+    
+    def _items_hash(self, content_items: List[Dict[str, Any]]) -> str:
+        """
+        Stable hash of a content item list for summary caching
+        """
+        payload = json.dumps(content_items, sort_keys=True, default=str)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+    
     async def _create_executive_summary(self, content_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate Superhuman-style executive summary
@@ -589,9 +640,12 @@ Articles are organized by business impact and industry relevance to help busy pr
         words = len(text.split())
         return max(1, words // 150)  # 150 words per minute
     
-    def _generate_html_newsletter(self, newsletter: Newsletter) -> str:
+    def _generate_html_newsletter(self, newsletter: Newsletter, personalized: bool = False) -> str:
         """
         Generate HTML version of newsletter
+        
+        With personalized=True the greeting and unsubscribe link are emitted as
+        sentinel placeholders, to be filled in by _personalize.
         """
         html = f"""
 <!DOCTYPE html>
@@ -606,10 +660,10 @@ Articles are organized by business impact and industry relevance to help busy pr
 </head>
 <body>
     <div class="container">
-        {self._generate_html_header(newsletter)}
+        {self._generate_html_header(newsletter, personalized)}
         {self._generate_html_summary(newsletter)}
         {self._generate_html_sections(newsletter)}
-        {self._generate_html_footer(newsletter)}
+        {self._generate_html_footer(newsletter, personalized)}
     </div>
 </body>
 </html>
@@ -741,13 +795,18 @@ Articles are organized by business impact and industry relevance to help busy pr
         }}
         """
     
-    def _generate_html_header(self, newsletter: Newsletter) -> str:
+    def _generate_html_header(self, newsletter: Newsletter, personalized: bool = False) -> str:
         """
         Generate HTML header section
         """
+        greeting = ""
+        if personalized:
+            greeting = f'<div class="meta">Hi {NAME_TOKEN.decode()},</div>'
+        
         return f"""
         <div class="header">
             <h1>AEC AI Weekly</h1>
+            {greeting}
             <div class="meta">
                 Issue #{newsletter.issue_number} • {newsletter.date.strftime('%B %d, %Y')} • {newsletter.metrics.estimated_read_time} min read
             </div>
@@ -829,18 +888,76 @@ Articles are organized by business impact and industry relevance to help busy pr
         
         return sections_html
     
-    def _generate_html_footer(self, newsletter: Newsletter) -> str:
+    def _generate_html_footer(self, newsletter: Newsletter, personalized: bool = False) -> str:
         """
         Generate HTML footer
         """
+        unsubscribe_href = UNSUB_TOKEN.decode() if personalized else "#unsubscribe"
+        
         return f"""
         <div class="footer">
             <p>Made with care for the AEC community<br>
-            <a href="#unsubscribe">Unsubscribe</a> | <a href="#archive">View Archive</a> | <a href="#feedback">Feedback</a></p>
+            <a href="{unsubscribe_href}">Unsubscribe</a> | <a href="#archive">View Archive</a> | <a href="#feedback">Feedback</a></p>
             <p><small>Generated on {newsletter.generation_timestamp.strftime('%Y-%m-%d %H:%M')} UTC</small></p>
         </div>
         """
     
+    def _render_shared_body(self, newsletter: Newsletter) -> bytes:
+        """
+        Render the subscriber-independent HTML body once, UTF-8 encoded
+        """
+        return self._generate_html_newsletter(newsletter, personalized=True).encode("utf-8")
+    
+    def _personalize(self, body: bytes, subscriber: Subscriber) -> bytes:
+        """
+        Fill the sentinel placeholders of a shared body for one subscriber
+        """
+        name = html.escape(subscriber.name or "there").encode("utf-8")
+        unsub_url = html.escape(subscriber.unsub_url).encode("utf-8")
+        return body.replace(NAME_TOKEN, name).replace(UNSUB_TOKEN, unsub_url)
+    
+    async def _personalize_newsletter(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Produce per-subscriber HTML bodies from a precompiled shared body
+        """
+        try:
+            subscribers = data.get("subscribers", [])
+            
+            if not self.generated_newsletters:
+                return {"status": "error", "message": "No newsletter generated yet"}
+            if not subscribers:
+                return {"status": "error", "message": "No subscribers provided"}
+            
+            issue_number = data.get("issue_number", self.generated_newsletters[-1].issue_number)
+            body = self.shared_bodies.get(issue_number)
+            
+            if body is None:
+                newsletter = next(
+                    (n for n in self.generated_newsletters if n.issue_number == issue_number), None
+                )
+                if newsletter is None:
+                    return {"status": "error", "message": f"Newsletter #{issue_number} not found"}
+                body = self._render_shared_body(newsletter)
+                self.shared_bodies[issue_number] = body
+            
+            personalize = self._personalize
+            messages = []
+            for sub in subscribers:
+                if isinstance(sub, dict):
+                    sub = Subscriber(**sub)
+                messages.append({"email": sub.email, "html_body": personalize(body, sub)})
+            
+            return {
+                "status": "success",
+                "issue_number": issue_number,
+                "total_personalized": len(messages),
+                "messages": messages
+            }
+            
+        except Exception as e:
+            logger.error(f"Error personalizing newsletter: {e}")
+            return {"status": "error", "message": str(e)}
+    
     def _generate_text_newsletter(self, newsletter: Newsletter) -> str:
         """
         Generate plain text version of newsletter
@@ -1126,5 +1243,9 @@ Unsubscribe | Archive | Feedback
         # Keep only recent newsletters in memory
         if len(self.generated_newsletters) > 50:
             self.generated_newsletters = self.generated_newsletters[-25:]
+            kept_issues = {n.issue_number for n in self.generated_newsletters}
+            self.shared_bodies = {
+                issue: body for issue, body in self.shared_bodies.items() if issue in kept_issues
+            }
         
         logger.info(f"WriterAgent {self.agent_id} cleaned up")
\ No newline at end of file
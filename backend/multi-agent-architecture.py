@@ -21,6 +21,7 @@ from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime
 import asyncio
+import signal
 from enum import Enum
 
 # =============================================================================
@@ -648,11 +649,19 @@ async def main():
     # Example MCP integration
     mcp_integration = MCPAgentIntegration(system)
     
-    # Run system (in production, this would be managed by orchestrator)
+    # Run system until SIGINT/SIGTERM (in production, this would be managed by orchestrator)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop_event.set))
+    
     try:
-        while True:
-            await asyncio.sleep(60)  # Keep system running
-    except KeyboardInterrupt:
+        await stop_event.wait()
+    finally:
         await system.stop_system()
 
 if __name__ == "__main__":
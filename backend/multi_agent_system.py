@@ -6,7 +6,7 @@ Main system coordinator for all agents as specified in architecture
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from dataclasses import dataclass
 
 # Import base classes and agents
@@ -25,6 +25,7 @@ except ImportError:
     arch_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'multi-agent-architecture.py')
     spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
     arch_module = importlib.util.module_from_spec(spec)
+    sys.modules["multi_agent_architecture"] = arch_module  # later imports reuse this copy
     spec.loader.exec_module(arch_module)
     BaseAgent = arch_module.BaseAgent
     AgentTask = arch_module.AgentTask
@@ -354,6 +355,80 @@ class MultiAgentSystem:
                 "message": str(e)
             }
     
+    async def execute_task_stream(self, task: AgentTask, batch_size: int = 5,
+                                  max_pending: int = 16,
+                                  timeout: Optional[float] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Execute a task and yield its articles in batches as they become available.
+        RSS discovery runs one sub-task per feed so consumers can start on early feeds;
+        at most max_pending batches are buffered. A sub-task still running after
+        timeout seconds is abandoned and contributes no articles. Failed sub-tasks
+        are logged; if every sub-task failed, RuntimeError is raised once the
+        stream ends so callers can tell a failure from an empty result.
+        """
+        feeds = task.data.get("feeds") if task.data.get("type") == "discover_rss" else None
+        
+        if feeds:
+            sub_tasks = [
+                AgentTask(
+                    task_id=f"{task.task_id}-{i}",
+                    agent_type=task.agent_type,
+                    priority=task.priority,
+                    data={**task.data, "feeds": [feed]},
+                    created_at=task.created_at
+                )
+                for i, feed in enumerate(feeds)
+            ]
+        else:
+            sub_tasks = [task]
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        failures: List[str] = []
+        
+        async def produce(sub_task: AgentTask):
+            try:
+                result = await asyncio.wait_for(self.execute_task(sub_task), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Task {sub_task.task_id} exceeded its {timeout}s budget")
+                failures.append(f"{sub_task.task_id}: exceeded its {timeout}s budget")
+                return
+            if self._stream_task_failed(result):
+                failures.append(f"{sub_task.task_id}: {result.get('message') or result.get('errors')}")
+            articles = result.get("articles", [])
+            for i in range(0, len(articles), batch_size):
+                await queue.put(articles[i:i + batch_size])
+        
+        runner = asyncio.ensure_future(asyncio.gather(*(produce(sub_task) for sub_task in sub_tasks)))
+        try:
+            # Take batches until the producers finish; no in-band sentinel, so nothing blocks on a full queue
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, runner}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                yield getter.result()
+            while not queue.empty():
+                yield queue.get_nowait()
+            runner.result()  # re-raise a producer exception
+        finally:
+            # Consumer stopped early; abandon the remaining feeds
+            runner.cancel()
+        
+        if failures and len(failures) == len(sub_tasks):
+            raise RuntimeError(f"Task {task.task_id} failed: {'; '.join(failures)}")
+        for failure in failures:
+            logger.warning(f"Streamed task partially failed: {failure}")
+    
+    @staticmethod
+    def _stream_task_failed(result: Dict[str, Any]) -> bool:
+        """
+        A sub-task failed if it errored, or (for discovery) reported errors without processing a feed
+        """
+        if result.get("status") != "success":
+            return True
+        return bool(result.get("errors")) and not result.get("feeds_processed")
+    
     async def trigger_discovery(self) -> Dict[str, Any]:
         """
         Manually trigger content discovery
@@ -451,7 +526,8 @@ def create_aec_news_system(business_config=None) -> MultiAgentSystem:
             "max_concurrent_scrapes": 5,
             "max_articles_per_source": 10,
             "content_freshness_hours": 48,
-            "rate_limit_delay": 2.0
+            "rate_limit_delay": 2.0,
+            "seen_urls_path": business_config.get("seen_urls_path")
         },
         orchestrator_config={
             "discovery_interval": 30,
@@ -8,10 +8,6 @@ import tempfile
 import shutil
 from pathlib import Path
 
-from ..core.config import SystemConfig
-from ..core.database import DatabaseManager
-from ..multi_agent_system import MultiAgentSystem
-
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -22,6 +18,10 @@ def event_loop():
 @pytest.fixture
 async def temp_database():
     """Create a temporary database for testing"""
+    # Imported here so unit tests collect without the database driver installed
+    from ..core.config import SystemConfig
+    from ..core.database import DatabaseManager
+    
     temp_dir = tempfile.mkdtemp()
     db_path = Path(temp_dir) / "test.db"
     
@@ -41,6 +41,9 @@ async def temp_database():
 @pytest.fixture
 async def test_system():
     """Create a test multi-agent system"""
+    from ..core.config import SystemConfig
+    from ..multi_agent_system import MultiAgentSystem
+    
     config = SystemConfig(
         database_url="sqlite:///:memory:",
         environment="test",
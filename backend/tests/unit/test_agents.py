@@ -10,9 +10,9 @@ from unittest.mock import Mock, AsyncMock
 from ...agents.scout.agent import ScoutAgent
 from ...agents.curator.agent import CuratorAgent
 from ...agents.writer.agent import WriterAgent
-from ...agents.orchestrator.agent import OrchestratorAgent
+from ...agents.orchestrator.agent import OrchestratorAgent, TaskPriority
 from ...agents.monitor.agent import MonitorAgent
-from ...core.agent_base import AgentTask, TaskPriority
+from ...core.agent_base import AgentTask
 
 class TestScoutAgent:
     """Unit tests for Scout Agent"""
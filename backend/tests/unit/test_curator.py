@@ -0,0 +1,61 @@
+"""
+Unit Tests for the Curator Agent's threshold filtering
+"""
+
+import random
+
+import pytest
+
+from ...agents.curator import agent as curator_module
+from ...agents.curator.agent import CuratorAgent
+
+pytestmark = pytest.mark.skipif(not curator_module.NUMPY_AVAILABLE, reason="numpy not installed")
+
+def make_analyses(pairs):
+    return [
+        {
+            "quality_metrics": {"overall_quality": quality},
+            "ai_relevance": {"overall_relevance": relevance}
+        }
+        for quality, relevance in pairs
+    ]
+
+def loop_partition(curator, analyses, monkeypatch):
+    """Partition through the pure-Python fallback"""
+    with monkeypatch.context() as patch:
+        patch.setattr(curator_module, "NUMPY_AVAILABLE", False)
+        return curator._partition_by_thresholds(analyses)
+
+class TestThresholdPartition:
+    """The quantized NumPy path must tier items exactly like the float loop"""
+    
+    @pytest.mark.parametrize("quality_threshold, relevance_threshold", [
+        (0.6, 0.4), (0.7, 0.8), (1.0, 1.0), (0.0, 0.0), (0.5, 0.3)
+    ])
+    def test_matches_loop_fallback_on_random_scores(self, monkeypatch, quality_threshold, relevance_threshold):
+        curator = CuratorAgent("test_curator_partition", {
+            "quality_threshold": quality_threshold,
+            "relevance_threshold": relevance_threshold
+        })
+        rng = random.Random(42)
+        # Random scores plus values exactly at, and one ulp either side of, every threshold
+        edges = [quality_threshold, relevance_threshold, 0.4, 0.3, 1.0, 0.0]
+        edges += [value + delta for value in edges for delta in (1e-9, -1e-9)]
+        
+        def score():
+            return rng.choice([rng.random(), round(rng.random(), 3), rng.choice(edges)])
+        
+        analyses = make_analyses((score(), score()) for _ in range(5000))
+        
+        assert curator._partition_by_thresholds(analyses) == loop_partition(curator, analyses, monkeypatch)
+    
+    def test_items_just_below_a_threshold_do_not_pass(self, monkeypatch):
+        curator = CuratorAgent("test_curator_partition", {
+            "quality_threshold": 0.6,
+            "relevance_threshold": 0.4
+        })
+        analyses = make_analyses([(0.599, 0.5), (0.6, 0.397), (0.395, 0.1), (0.1, 0.297)])
+        
+        expected = ([], [0, 1], [2, 3])
+        assert curator._partition_by_thresholds(analyses) == expected
+        assert loop_partition(curator, analyses, monkeypatch) == expected
@@ -0,0 +1,121 @@
+"""
+Unit Tests for MultiAgentSystem task streaming
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from ...multi_agent_system import MultiAgentSystem, AgentTask
+
+def make_system(execute_task) -> MultiAgentSystem:
+    """System whose execute_task is replaced by the given coroutine function"""
+    system = MultiAgentSystem.__new__(MultiAgentSystem)
+    system.execute_task = execute_task
+    return system
+
+def discovery_task(*feeds: str) -> AgentTask:
+    return AgentTask(
+        task_id="test_stream_001",
+        agent_type="scout",
+        priority=1,
+        data={"type": "discover_rss", "feeds": list(feeds)},
+        created_at=datetime.now()
+    )
+
+async def articles_for_feed(task: AgentTask):
+    feed = task.data["feeds"][0]
+    count = int(feed.rsplit("/", 1)[-1])
+    return {"status": "success", "feeds_processed": 1,
+            "articles": [{"url": f"{feed}#{i}"} for i in range(count)]}
+
+async def collect(stream):
+    return [batch async for batch in stream]
+
+class TestExecuteTaskStream:
+    """Batching, early exit and failure reporting"""
+    
+    @pytest.mark.asyncio
+    async def test_yields_every_article_in_batches(self):
+        system = make_system(articles_for_feed)
+        
+        batches = await collect(system.execute_task_stream(
+            discovery_task("https://a.example/3", "https://b.example/4"), batch_size=2
+        ))
+        
+        assert all(len(batch) <= 2 for batch in batches)
+        assert sorted(a["url"] for batch in batches for a in batch) == sorted(
+            [f"https://a.example/3#{i}" for i in range(3)] + [f"https://b.example/4#{i}" for i in range(4)]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_early_exit_with_a_full_queue_does_not_hang(self):
+        system = make_system(articles_for_feed)
+        stream = system.execute_task_stream(
+            discovery_task("https://a.example/20", "https://b.example/20"), batch_size=1, max_pending=1
+        )
+        
+        async def take_one():
+            async for batch in stream:
+                return batch
+        
+        first = await asyncio.wait_for(take_one(), timeout=1.0)
+        await asyncio.wait_for(stream.aclose(), timeout=1.0)
+        
+        assert len(first) == 1
+    
+    @pytest.mark.asyncio
+    async def test_producers_finishing_on_a_full_queue_still_end_the_stream(self):
+        system = make_system(articles_for_feed)
+        
+        batches = await asyncio.wait_for(collect(system.execute_task_stream(
+            discovery_task("https://a.example/5"), batch_size=1, max_pending=1
+        )), timeout=1.0)
+        
+        assert len(batches) == 5
+    
+    @pytest.mark.asyncio
+    async def test_raises_when_every_sub_task_fails(self):
+        async def unreachable(task):
+            return {"status": "success", "feeds_processed": 0, "errors": ["Name or service not known"]}
+        
+        system = make_system(unreachable)
+        
+        with pytest.raises(RuntimeError, match="Name or service not known"):
+            await collect(system.execute_task_stream(discovery_task("https://a.example/1", "https://b.example/1")))
+    
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_the_successful_feeds(self):
+        async def flaky(task):
+            if task.data["feeds"][0].startswith("https://down."):
+                return {"status": "error", "message": "unreachable"}
+            return await articles_for_feed(task)
+        
+        system = make_system(flaky)
+        
+        batches = await collect(system.execute_task_stream(discovery_task("https://down.example/1", "https://a.example/2")))
+        
+        assert [a["url"] for batch in batches for a in batch] == ["https://a.example/2#0", "https://a.example/2#1"]
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_sub_tasks_count_as_failures(self):
+        async def slow(task):
+            await asyncio.sleep(10)
+        
+        system = make_system(slow)
+        
+        with pytest.raises(RuntimeError, match="budget"):
+            await asyncio.wait_for(collect(system.execute_task_stream(
+                discovery_task("https://a.example/1"), timeout=0.05
+            )), timeout=1.0)
+    
+    @pytest.mark.asyncio
+    async def test_producer_exceptions_propagate(self):
+        async def broken(task):
+            raise ValueError("agent crashed")
+        
+        system = make_system(broken)
+        
+        with pytest.raises(ValueError, match="agent crashed"):
+            await collect(system.execute_task_stream(discovery_task("https://a.example/1")))
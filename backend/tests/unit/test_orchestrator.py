@@ -0,0 +1,141 @@
+"""
+Unit Tests for the Orchestrator's pipeline coordination and task ordering
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from ...agents.curator.agent import CuratorAgent
+from ...agents.orchestrator.agent import (
+    OrchestratorAgent, ScheduledTask, TaskPriority, AgentHealth, AgentStatus, AgentTask
+)
+
+def make_analysis(quality: float, analyzed_at: datetime) -> SimpleNamespace:
+    """Stand-in for a ContentAnalysis carrying only what the backlog count reads"""
+    return SimpleNamespace(
+        quality_metrics=SimpleNamespace(overall_quality=quality),
+        analysis_timestamp=analyzed_at
+    )
+
+def make_orchestrator(curated: int, min_batch: int = 3) -> OrchestratorAgent:
+    """Orchestrator with a registered Curator holding curated good items and one below threshold"""
+    curator = CuratorAgent("test_curator_backlog", {"quality_threshold": 0.6})
+    now = datetime.now()
+    curator.analyzed_content = [make_analysis(0.9, now) for _ in range(curated)]
+    curator.analyzed_content.append(make_analysis(0.2, now))
+    
+    orchestrator = OrchestratorAgent("test_orchestrator_backlog", {"writer_min_batch_size": min_batch})
+    orchestrator.registered_agents["curator"] = curator
+    return orchestrator
+
+def make_scheduled(agent_target: str, priority: TaskPriority, name: str = "") -> ScheduledTask:
+    """Due task for agent_target; name tells tasks for the same agent apart"""
+    now = datetime.now()
+    task = AgentTask(
+        task_id=name or agent_target,
+        agent_type=agent_target,
+        priority=priority.value,
+        data={},
+        created_at=now
+    )
+    return ScheduledTask(task=task, scheduled_time=now, priority=priority, agent_target=agent_target)
+
+def writer_tasks(orchestrator: OrchestratorAgent) -> list:
+    return [t for t in orchestrator.task_queue if t.agent_target == "writer"]
+
+class TestWriterBatchGate:
+    """Newsletter generation waits for a full batch of curated content"""
+    
+    @pytest.mark.asyncio
+    async def test_below_threshold_holds_the_writer(self):
+        orchestrator = make_orchestrator(curated=2)
+        
+        result = await orchestrator._coordinate_content_pipeline()
+        
+        status = result["pipeline_status"]
+        assert status["curated_backlog"] == 2
+        assert status["writer_status"] == "waiting_for_content"
+        assert writer_tasks(orchestrator) == []
+        assert orchestrator.last_newsletter is None
+    
+    @pytest.mark.asyncio
+    async def test_at_threshold_schedules_the_writer(self):
+        orchestrator = make_orchestrator(curated=3)
+        
+        result = await orchestrator._coordinate_content_pipeline()
+        
+        assert result["pipeline_status"]["curated_backlog"] == 3
+        assert len(writer_tasks(orchestrator)) == 1
+        assert orchestrator.last_newsletter is not None
+    
+    @pytest.mark.asyncio
+    async def test_backlog_counts_only_items_since_the_last_newsletter(self):
+        orchestrator = make_orchestrator(curated=5)
+        curator = orchestrator.registered_agents["curator"]
+        for analysis in curator.analyzed_content[:3]:
+            analysis.analysis_timestamp -= timedelta(days=3)
+        orchestrator.last_newsletter = datetime.now() - timedelta(days=2, minutes=1)
+        
+        assert await orchestrator._curated_backlog_size() == 2
+    
+    @pytest.mark.asyncio
+    async def test_missing_curator_does_not_gate(self):
+        orchestrator = OrchestratorAgent("test_orchestrator_backlog", {"writer_min_batch_size": 3})
+        
+        result = await orchestrator._coordinate_content_pipeline()
+        
+        assert result["pipeline_status"]["curated_backlog"] is None
+        assert len(writer_tasks(orchestrator)) == 1
+
+class TestCriticalPathOrdering:
+    """Due tasks start by downstream pipeline depth, then by static priority"""
+    
+    def test_deeper_pipeline_stages_start_first(self):
+        orchestrator = OrchestratorAgent("test_orchestrator_order", {})
+        due = [
+            make_scheduled("writer", TaskPriority.CRITICAL),
+            make_scheduled("curator", TaskPriority.HIGH),
+            make_scheduled("scout", TaskPriority.BACKGROUND)
+        ]
+        
+        ordered = orchestrator._order_due_tasks(due)
+        
+        assert [t.agent_target for t in ordered] == ["scout", "curator", "writer"]
+    
+    def test_priority_breaks_ties_within_a_stage(self):
+        orchestrator = OrchestratorAgent("test_orchestrator_order", {})
+        due = [
+            make_scheduled("curator", TaskPriority.LOW, "curator-low"),
+            make_scheduled("writer", TaskPriority.CRITICAL, "writer-critical"),
+            make_scheduled("curator", TaskPriority.HIGH, "curator-high"),
+            make_scheduled("scout", TaskPriority.MEDIUM, "scout-medium"),
+            make_scheduled("scout", TaskPriority.CRITICAL, "scout-critical")
+        ]
+        
+        ordered = orchestrator._order_due_tasks(due)
+        
+        assert [t.task.task_id for t in ordered] == [
+            "scout-critical", "scout-medium", "curator-high", "curator-low", "writer-critical"
+        ]
+    
+    def test_measured_service_times_extend_the_path(self):
+        orchestrator = OrchestratorAgent("test_orchestrator_order", {})
+        for agent_id, seconds in (("scout", 2.0), ("curator", 0.5), ("writer", 30.0)):
+            orchestrator.agent_health[agent_id] = AgentHealth(
+                agent_id=agent_id,
+                status=AgentStatus.IDLE,
+                last_heartbeat=datetime.now(),
+                average_response_time=seconds
+            )
+        
+        ranks = {}
+        assert orchestrator._critical_path_rank("scout", ranks) == pytest.approx(32.5)
+        assert ranks == {"writer": 30.0, "curator": 30.5, "scout": 32.5}
+        
+        ordered = orchestrator._order_due_tasks([
+            make_scheduled("writer", TaskPriority.CRITICAL),
+            make_scheduled("scout", TaskPriority.LOW)
+        ])
+        assert [t.agent_target for t in ordered] == ["scout", "writer"]
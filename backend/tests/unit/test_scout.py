@@ -0,0 +1,416 @@
+"""
+Unit Tests for the Scout Agent's feed fetching and parsing
+"""
+
+import asyncio
+import io
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import httpx
+import feedparser
+
+from ...agents.scout import agent as scout_agent
+from ...agents.scout.agent import (
+    ScoutAgent, AdaptiveLimiter, SeenURLSet, sniff_feed_type, parse_json_feed, plain_text
+)
+
+RSS_ITEMS = "".join(
+    f"<item><title>Article {i}</title><link>https://example.com/a/{i}</link></item>"
+    for i in range(5)
+)
+RSS_FEED = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>Test Feed</title>'
+    + RSS_ITEMS + "</channel></rss>"
+).encode("utf-8")
+
+def chunked(body: bytes, size: int = 7):
+    """Async byte stream delivering body in small chunks"""
+    async def stream():
+        for i in range(0, len(body), size):
+            yield body[i:i + size]
+    return stream()
+
+def make_scout(handler, **config) -> ScoutAgent:
+    """Scout whose HTTP client answers every request through handler"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ScoutAgent("test_scout_feeds", {"http_client": client, **config})
+
+async def close_scout(scout: ScoutAgent):
+    await scout.cleanup()
+    await scout.session.aclose()
+
+class TestFeedFetching:
+    """Streaming download, item-limit cut and conditional GET"""
+    
+    @pytest.mark.asyncio
+    async def test_well_formed_feed_is_kept_whole(self):
+        scout = make_scout(lambda request: httpx.Response(200, content=chunked(RSS_FEED)))
+        try:
+            body, validators = await scout._fetch_feed_body("https://example.com/rss")
+            with body:
+                assert body.read() == RSS_FEED
+                body.seek(0)
+                feed = scout._parse_feed(body)
+            assert len(feed.entries) == 5
+            assert validators[2] is not None
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_item_limit_cuts_a_well_formed_prefix(self):
+        scout = make_scout(lambda request: httpx.Response(200, content=chunked(RSS_FEED)))
+        try:
+            body, _ = await scout._fetch_feed_body("https://example.com/rss", max_items=2)
+            with body:
+                data = body.read()
+                body.seek(0)
+                feed = scout._parse_feed(body)
+            assert data.endswith(b"</item></channel></rss>")
+            assert b"Article 2" not in data
+            assert [entry.title for entry in feed.entries] == ["Article 0", "Article 1"]
+            assert not feed.bozo
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_cut_off_feed_keeps_complete_items(self):
+        truncated = RSS_FEED[:RSS_FEED.index(b"<item><title>Article 3")] + b"<item><title>Arti"
+        scout = make_scout(lambda request: httpx.Response(200, content=chunked(truncated)))
+        try:
+            result = await scout._process_rss_feed("https://example.com/rss")
+            assert result["status"] == "success"
+            assert result["articles_found"] >= 3
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_malformed_feed_falls_back_without_cutting(self):
+        malformed = b"<rss><channel><item><title>A & B</title></item><item></channel>"
+        scout = make_scout(lambda request: httpx.Response(200, content=chunked(malformed)))
+        try:
+            body, _ = await scout._fetch_feed_body("https://example.com/rss", max_items=1)
+            with body:
+                assert body.read() == malformed
+            result = await scout._process_rss_feed("https://example.com/rss")
+            assert result["status"] == "success"
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_html_page_is_rejected(self):
+        page = b"<!DOCTYPE html><html><body>Moved</body></html>"
+        scout = make_scout(lambda request: httpx.Response(200, content=page))
+        try:
+            result = await scout._process_rss_feed("https://example.com/rss")
+            assert result["status"] == "error"
+            assert "HTML" in result["error"]
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_oversized_feed_is_truncated_and_spilled(self):
+        scout = make_scout(
+            lambda request: httpx.Response(200, content=chunked(RSS_FEED, 16)),
+            max_feed_bytes=64,
+            feed_spool_bytes=32
+        )
+        try:
+            body, _ = await scout._fetch_feed_body("https://example.com/rss")
+            with body:
+                assert body._rolled
+                assert 64 <= len(body.read()) < len(RSS_FEED)
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_response_skips_the_feed(self):
+        seen_headers = []
+        
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS_FEED, headers={"ETag": '"v1"'})
+        
+        scout = make_scout(handler)
+        try:
+            first = await scout._discover_from_rss(["https://example.com/rss"])
+            second = await scout._discover_from_rss(["https://example.com/rss"])
+            
+            assert first["feeds_cached"] == 0 and first["articles_discovered"] == 5
+            assert second["feeds_cached"] == 1 and second["articles_discovered"] == 0
+            assert seen_headers[0] is None and seen_headers[-1] == '"v1"'
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_body_without_validators_is_skipped(self):
+        scout = make_scout(lambda request: httpx.Response(200, content=RSS_FEED))
+        try:
+            await scout._discover_from_rss(["https://example.com/rss"])
+            body, validators = await scout._fetch_feed_body("https://example.com/rss")
+            assert body is None
+            assert validators[0] is None and validators[2] is not None
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_failed_processing_does_not_mark_the_feed_unchanged(self):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS_FEED, headers={"ETag": '"v1"'})
+        
+        scout = make_scout(handler)
+        try:
+            def fail(body):
+                raise ValueError("parse failed")
+            
+            parse_feed, scout._parse_feed = scout._parse_feed, fail
+            failed = await scout._process_rss_feed("https://example.com/rss")
+            scout._parse_feed = parse_feed
+            retried = await scout._process_rss_feed("https://example.com/rss")
+            
+            assert failed["status"] == "error"
+            assert retried["articles_found"] == 5 and not retried.get("not_modified")
+        finally:
+            await close_scout(scout)
+
+class TestAdaptiveLimiter:
+    """Concurrency bound, overload backoff and slot release"""
+    
+    @pytest.mark.asyncio
+    async def test_in_flight_never_exceeds_the_limit(self):
+        limiter = AdaptiveLimiter(min_limit=2, max_limit=2)
+        peak = 0
+        
+        async def request():
+            nonlocal peak
+            async with limiter.use():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+        
+        await asyncio.gather(*(request() for _ in range(10)))
+        
+        assert peak == 2
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_limit_grows_while_latency_stays_flat(self):
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=4)
+        
+        for _ in range(10):
+            async with limiter.use():
+                pass
+        
+        assert limiter.limit == 4
+    
+    @pytest.mark.asyncio
+    async def test_timeout_halves_the_limit_and_backs_off(self):
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=8, backoff_delay=0.05)
+        limiter.limit = 8
+        loop = asyncio.get_event_loop()
+        
+        started = loop.time()
+        with pytest.raises(httpx.ReadTimeout):
+            async with limiter.use():
+                raise httpx.ReadTimeout("slow upstream")
+        
+        assert limiter.limit == 4
+        assert loop.time() - started >= 0.05
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_during_backoff_releases_the_slot(self):
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=1, backoff_delay=2.0)
+        
+        async def overloaded():
+            async with limiter.use():
+                response = httpx.Response(503, request=httpx.Request("GET", "https://example.com"))
+                response.raise_for_status()
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(overloaded(), timeout=0.1)
+        await asyncio.sleep(0)
+        
+        assert limiter.in_flight == 0
+        
+        async def follow_up():
+            async with limiter.use():
+                return "ok"
+        
+        assert await asyncio.wait_for(follow_up(), timeout=1.0) == "ok"
+
+class TestSeenURLSet:
+    """Bounded, persistable seen-URL fallback used without pybloom_live"""
+    
+    def test_oldest_urls_are_evicted_at_the_cap(self):
+        seen = SeenURLSet(max_size=3)
+        for i in range(5):
+            seen.add(f"https://example.com/{i}")
+        
+        assert len(seen) == 3
+        assert "https://example.com/1" not in seen
+        assert all(f"https://example.com/{i}" in seen for i in (2, 3, 4))
+    
+    @pytest.mark.asyncio
+    async def test_fallback_persists_between_scouts(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scout_agent, "BLOOM_AVAILABLE", False)
+        config = {"seen_urls_path": str(tmp_path / "seen.json"), "seen_urls_flush_every": 2, "seen_urls_max": 2}
+        
+        first = make_scout(lambda request: httpx.Response(404), **config)
+        try:
+            for i in range(3):
+                first._remember_url(f"https://example.com/{i}")
+        finally:
+            await close_scout(first)
+        
+        second = make_scout(lambda request: httpx.Response(404), **config)
+        try:
+            assert isinstance(second.seen_urls, SeenURLSet)
+            assert len(second.seen_urls) == 2
+            assert "https://example.com/0" not in second.seen_urls
+            assert "https://example.com/2" in second.seen_urls
+        finally:
+            await close_scout(second)
+
+class TestFeedSniffing:
+    """Feed type detection from the first bytes, and JSON Feed parsing"""
+    
+    @pytest.mark.parametrize("head, expected", [
+        (b'{"version": "https://jsonfeed.org/version/1.1", "items": []}', "json"),
+        (b'\xef\xbb\xbf  {"items": []}', "json"),
+        (b'<?xml version="1.0"?><rss version="2.0"><channel>', "xml"),
+        (b'<feed xmlns="http://www.w3.org/2005/Atom"><title>', "xml"),
+        (b'\xef\xbb\xbf<?xml version="1.0"?><rss>', "xml"),
+        (b'<?xml version="1.0"?><!-- mirrored from <html> pages --><rss>', "xml"),
+        (b'<?xml-stylesheet href="<html"?><feed>', "xml"),
+        (b'<!DOCTYPE rss SYSTEM "rss.dtd"><rss>', "xml"),
+        (b'<?xml version="1.0"?><!-- comment still open at <html', "xml"),
+        (b'<!DOCTYPE html><html><head>', "html"),
+        (b'<!-- error page --><HTML><body>', "html"),
+        (b'\r\n  <html lang="en">', "html"),
+    ])
+    def test_sniff_feed_type(self, head, expected):
+        assert sniff_feed_type(head) == expected
+    
+    def test_parse_json_feed(self):
+        body = io.BytesIO(json.dumps({
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": "JSON Feed",
+            "items": [
+                {"id": "1", "url": "https://example.com/1", "title": "One",
+                 "summary": "First", "date_published": "2026-10-12T10:00:00Z"},
+                {"id": "2", "external_url": "https://example.com/2", "content_text": "Second"}
+            ]
+        }).encode("utf-8"))
+        
+        feed = parse_json_feed(body)
+        
+        assert feed.feed.title == "JSON Feed"
+        assert not feed.bozo
+        assert [(e.id, e.link, e.summary) for e in feed.entries] == [
+            ("1", "https://example.com/1", "First"),
+            ("2", "https://example.com/2", "Second")
+        ]
+        assert feed.entries[0].published == "2026-10-12T10:00:00Z"
+    
+    @pytest.mark.parametrize("body", [
+        RSS_FEED,
+        b'<?xml version="1.0"?><!-- <html> --><feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>'
+        + b"".join(
+            b'<entry><id>%d</id><title>Article %d</title><link href="https://example.com/a/%d"/></entry>' % (i, i, i)
+            for i in range(5)
+        ) + b"</feed>",
+        json.dumps({"title": "JSON", "items": [
+            {"id": str(i), "url": f"https://example.com/a/{i}", "title": f"Article {i}"} for i in range(5)
+        ]}).encode("utf-8")
+    ], ids=["rss", "atom", "json"])
+    @pytest.mark.asyncio
+    async def test_parse_feed_dispatches_by_format(self, body):
+        scout = make_scout(lambda request: httpx.Response(404))
+        try:
+            feed = scout._parse_feed(io.BytesIO(body))
+            assert [entry.link for entry in feed.entries] == [f"https://example.com/a/{i}" for i in range(5)]
+        finally:
+            await close_scout(scout)
+
+HTML_SUMMARY_FEED = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><title>HTML Feed</title><item>'
+    b"<title>Tools &amp; Trends</title><link>https://example.com/html</link>"
+    b"<description>&lt;p&gt;BIM &lt;b&gt;meets&lt;/b&gt; AI&lt;/p&gt;&lt;script&gt;x()&lt;/script&gt;</description>"
+    b"</item></channel></rss>"
+)
+
+class TestSummaryNormalisation:
+    """feedparser and lxml paths hand the Scout the same plain-text fields"""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("Plain summary ", "Plain summary"),
+        ("<p>BIM <b>meets</b> AI</p>", "BIM meets AI"),
+        ("<p>Kept</p><style>p {}</style>", "Kept"),
+        ("Tools &amp; Trends", "Tools & Trends")
+    ])
+    def test_plain_text(self, text, expected):
+        assert plain_text(text) == expected
+    
+    @pytest.mark.parametrize("use_lxml", [False, True], ids=["feedparser", "lxml"])
+    @pytest.mark.asyncio
+    async def test_both_parsers_yield_plain_summaries(self, use_lxml, monkeypatch):
+        if use_lxml:
+            pytest.importorskip("lxml")
+        monkeypatch.setattr(scout_agent, "LXML_AVAILABLE", use_lxml)
+        scout = make_scout(lambda request: httpx.Response(404))
+        try:
+            entry = scout._parse_feed(io.BytesIO(HTML_SUMMARY_FEED)).entries[0]
+            article = await scout._extract_article_from_entry(entry, "https://example.com/rss")
+            assert article["title"] == "Tools & Trends"
+            assert article["summary"] == "BIM meets AI"
+            # Hex digest, the same form _scrape_single_url stores
+            assert json.loads(json.dumps(article["content_hash"])) == article["content_hash"]
+            assert len(article["content_hash"]) == 32
+        finally:
+            await close_scout(scout)
+
+@pytest.fixture
+def non_utc_local_time(monkeypatch):
+    """Run under a local zone far from UTC, so local/UTC mix-ups show"""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+class TestPublishedDates:
+    """Published dates are naive UTC whichever field they come from"""
+    
+    @pytest.mark.asyncio
+    async def test_parsed_and_string_dates_agree(self, non_utc_local_time):
+        scout = make_scout(lambda request: httpx.Response(404))
+        try:
+            from_struct = feedparser.FeedParserDict(
+                published_parsed=time.strptime("2026-10-12 10:00:00", "%Y-%m-%d %H:%M:%S")
+            )
+            from_string = feedparser.FeedParserDict(published="Mon, 12 Oct 2026 12:00:00 +0200")
+            
+            expected = datetime(2026, 10, 12, 10, 0)
+            assert scout._parse_published_date(from_struct) == expected
+            assert scout._parse_published_date(from_string) == expected
+        finally:
+            await close_scout(scout)
+    
+    @pytest.mark.asyncio
+    async def test_freshness_compares_in_utc(self, non_utc_local_time):
+        scout = make_scout(lambda request: httpx.Response(404), content_freshness_hours=2)
+        try:
+            recent = datetime.utcnow() - timedelta(hours=1)
+            stale = datetime.utcnow() - timedelta(hours=3)
+            
+            assert scout._is_content_fresh({"published_date": recent})
+            assert not scout._is_content_fresh({"published_date": stale})
+            assert scout._is_content_fresh({"published_date": recent.isoformat() + "Z"})
+        finally:
+            await close_scout(scout)
@@ -0,0 +1,29 @@
+"""
+Unit Tests for the Writer Agent
+"""
+
+import pytest
+
+from ...agents.writer.agent import WriterAgent, Subscriber, NAME_TOKEN, UNSUB_TOKEN
+
+class TestWriterPersonalization:
+    """Unit tests for per-subscriber personalization"""
+    
+    @pytest.fixture
+    def writer_agent(self):
+        return WriterAgent("test_writer_001", {
+            "newsletter_template": "standard",
+            "max_articles": 8
+        })
+    
+    def test_personalize_shared_body(self, writer_agent):
+        """Test bytes-level personalization of a precompiled body"""
+        body = b"<p>Hi " + NAME_TOKEN + b'</p><a href="' + UNSUB_TOKEN + b'">x</a>'
+        
+        result = writer_agent._personalize(body, Subscriber(
+            email="ann@example.com",
+            name="Ann <Admin>",
+            unsub_url="https://example.com/u/1"
+        ))
+        
+        assert result == b'<p>Hi Ann &lt;Admin&gt;</p><a href="https://example.com/u/1">x</a>'
@@ -0,0 +1,22 @@
+"""
+Root pytest configuration
+
+Imports the Scout's heavy HTTP and feed-parsing dependencies once at collection,
+so the root-level test scripts find them in sys.modules instead of paying the
+import cost inside a test.
+"""
+
+import importlib
+
+# lxml is optional for the Scout; the rest are hard dependencies
+WARM_MODULES = ("httpx", "feedparser", "bs4", "dateutil.parser", "lxml.etree")
+
+def warm_imports():
+    """Import WARM_MODULES, skipping any that are not installed"""
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+warm_imports()
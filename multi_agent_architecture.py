@@ -0,0 +1,18 @@
+"""
+Importable alias for multi-agent-architecture.py
+
+The architecture file name contains hyphens, so it cannot be imported directly.
+This module loads it under the name ``multi_agent_architecture`` and replaces
+itself in sys.modules, so ``import multi_agent_architecture`` yields the real
+module (with its bytecode cached in __pycache__ like any other import).
+"""
+
+import importlib.util
+import os
+import sys
+
+_arch_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multi-agent-architecture.py")
+_spec = importlib.util.spec_from_file_location(__name__, _arch_path)
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[__name__] = _module
+_spec.loader.exec_module(_module)
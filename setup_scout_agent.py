@@ -10,6 +10,16 @@ import subprocess
 import asyncio
 from pathlib import Path
 
+SCOUT_AGENT_DIR = Path(__file__).parent / "backend" / "agents" / "scout"
+
+def load_scout_module():
+    """Import the Scout Agent module once; later calls hit sys.modules"""
+    if str(SCOUT_AGENT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCOUT_AGENT_DIR))
+    
+    import agent
+    return agent
+
 def setup_directory_structure():
     """Create necessary directories for Scout Agent"""
     base_dir = Path(__file__).parent
@@ -35,7 +45,14 @@ def install_dependencies():
     
     try:
         subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
+            sys.executable, "-m", "pip", "install", "--upgrade", "pip", "wheel"
+        ], check=True)
+        # Prefer wheels everywhere; never source-build the compiled packages.
+        # A blanket --only-binary=:all: would reject sgmllib3k (feedparser), which is sdist-only.
+        subprocess.run([
+            sys.executable, "-m", "pip", "install",
+            "--prefer-binary", "--only-binary=numpy,cryptography,cffi,psutil",
+            "-r", "requirements.txt"
         ], check=True)
         print("Dependencies installed successfully")
     except subprocess.CalledProcessError as e:
@@ -49,12 +66,8 @@ def verify_installation():
     print("Verifying Scout Agent installation...")
     
     try:
-        # Add the backend agents directory to Python path
-        sys.path.insert(0, str(Path(__file__).parent / "backend" / "agents" / "scout"))
-        
         # Import Scout Agent
-        from agent import ScoutAgent
-        from multi_agent_architecture import AgentTask
+        ScoutAgent = load_scout_module().ScoutAgent
         
         # Test configuration
         test_config = {
@@ -86,9 +99,9 @@ async def run_scout_test():
     print("Running Scout Agent test...")
     
     try:
-        sys.path.insert(0, str(Path(__file__).parent / "backend" / "agents" / "scout"))
-        from agent import ScoutAgent
-        from multi_agent_architecture import AgentTask
+        scout_module = load_scout_module()
+        ScoutAgent = scout_module.ScoutAgent
+        AgentTask = scout_module.AgentTask
         from datetime import datetime
         
         # Test configuration
@@ -117,7 +130,7 @@ async def run_scout_test():
             priority=1,
             data={
                 "type": "discover_rss",
-                "feeds": config["rss_feeds"][:1]
+                "feeds": config["rss_feeds"]
             },
             created_at=datetime.now()
         )
@@ -6,260 +6,463 @@ Test Enhanced Scout Agent with Advanced Scraping and YouTube Integration
 import sys
 import os
 import asyncio
+from collections import ChainMap, deque
+from contextlib import asynccontextmanager
+from datetime import datetime
+import functools
+import importlib.util
+import hashlib
+import io
+import json
 import logging
+from types import MappingProxyType
+import tempfile
+import time
+
+import httpx
+
+# Prefer uvloop's faster event loop when installed; Windows falls back to the selector loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'agents', 'scout'))
 
+import multi_agent_architecture as arch_module
+
+# Upper bound on in-flight HTTP requests across every scout component
+MAX_HTTP_CONNECTIONS = 10
+# Longest a request waits for a free pooled connection before raising PoolTimeout
+HTTP_POOL_TIMEOUT = 60.0
+
+RSS_FEEDS = (
+    "https://www.archdaily.com/rss/",
+    "https://feeds.feedburner.com/TEDTalks_video"
+)
+
+# Test configuration and task payloads are read-only module constants
+CONFIG = MappingProxyType({
+    # Basic RSS config
+    "rss_feeds": RSS_FEEDS,
+    "scraping_interval": 30,
+    "max_concurrent_scrapes": 2,
+    "max_articles_per_source": 2,
+    "rate_limit_delay": 2.0,
+    
+    # Enhanced features config
+    "enable_advanced_scraping": True,
+    "enable_search": True,
+    "enable_youtube": True,
+    
+    # Search configuration (no API keys for testing)
+    "web_search_limit": 5,
+    "youtube_search_limit": 3,
+    
+    # Advanced scraper config
+    "use_scrapling": True,
+    "scraper_max_retries": 2,
+    "scraper_retry_delay": 3.0,
+    "scraper_timeout": 20.0,
+    
+    # Search queries
+    "search_queries": (
+        "AI construction 2024",
+        "BIM artificial intelligence"
+    ),
+    "youtube_search_queries": (
+        "AI construction",
+        "BIM artificial intelligence"
+    )
+})
+
+RSS_DATA = MappingProxyType({
+    "type": "discover_rss",
+    "feeds": RSS_FEEDS
+})
+
+SCRAPE_DATA = MappingProxyType({
+    "type": "scrape_url_advanced",
+    "url": "https://httpbin.org/html"  # Safe test URL
+})
+
+SEARCH_DATA = MappingProxyType({
+    "type": "search_web",
+    "query": "AI construction industry",
+    "max_results": 3
+})
+
+YOUTUBE_DATA = MappingProxyType({
+    "type": "search_youtube",
+    "max_videos": 2
+})
+
+# Keyed search providers behind Test 4 and the environment variables each one needs
+SEARCH_PROVIDER_KEYS = MappingProxyType({
+    "Bing": ("BING_API_KEY",),
+    "Google": ("GOOGLE_API_KEY", "GOOGLE_CSE_ID"),
+    "SerpAPI": ("SERPAPI_KEY",)
+})
+
+COMPREHENSIVE_DATA = MappingProxyType({
+    "type": "comprehensive_discovery",
+    "include_rss": True,
+    "include_search": True,
+    "include_youtube": False,  # Skip YouTube to avoid API errors
+    "search_queries": ("AI architecture design",)
+})
+
+CONTENT_DATA = MappingProxyType({
+    "type": "get_enhanced_content",
+    "max_items": 10,
+    "min_relevance": 0.0,
+    "include_youtube": False,
+    "include_search": True
+})
+
+def make_task(task_id, data, created_at):
+    """Build a scout AgentTask; callers share one created_at per test section"""
+    return arch_module.AgentTask(
+        task_id=task_id,
+        agent_type="scout",
+        priority=1,
+        data=data,
+        created_at=created_at
+    )
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def test_enhanced_scout_agent():
+# Test output is buffered and written once per section to keep stdout writes off the event loop
+_output = io.StringIO()
+
+def emit(*args):
+    """Buffer a line of test output"""
+    print(*args, file=_output)
+
+def _write_stdout(text):
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+async def flush_output():
+    """Write buffered output to stdout in one call"""
+    text = _output.getvalue()
+    if text:
+        _output.seek(0)
+        _output.truncate()
+        await asyncio.get_event_loop().run_in_executor(None, _write_stdout, text)
+
+# Per-task profile of this run: queue wait, execution latency and context for each task
+TASK_STATS = []
+TASK_STATS_PATH = os.path.join(tempfile.gettempdir(), "aec_ai_news_scout_task_stats.jsonl")
+TASK_STATS_KEEP_RUNS = 50  # older runs are dropped from the log
+
+@asynccontextmanager
+async def timed(task, stats):
+    """Record how long task waited since creation and how long it then ran"""
+    queue_wait = (datetime.now() - task.created_at).total_seconds()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.append({
+            "task_id": task.task_id,
+            "type": task.data.get("type"),
+            "queue_wait": queue_wait,
+            "latency": time.perf_counter() - started
+        })
+
+def report_task_stats(stats):
+    """Emit the slowest tasks first and log this run's profile, keeping only the last TASK_STATS_KEEP_RUNS runs"""
+    if not stats:
+        return
+    emit("\nTask timings (slowest first):")
+    for entry in sorted(stats, key=lambda e: e["latency"], reverse=True):
+        emit(f"   {entry['task_id']:<24} {entry['type'] or '-':<24} "
+             f"ran {entry['latency']:.3f}s, queued {entry['queue_wait']:.3f}s")
+    try:
+        runs = deque(maxlen=TASK_STATS_KEEP_RUNS)
+        if os.path.exists(TASK_STATS_PATH):
+            with open(TASK_STATS_PATH) as f:
+                runs.extend(line for line in f if line.strip())
+        runs.append(json.dumps({"run_at": datetime.now().isoformat(), "tasks": stats}) + "\n")
+        
+        partial_path = TASK_STATS_PATH + ".tmp"
+        with open(partial_path, "w") as f:
+            f.writelines(runs)
+        os.replace(partial_path, TASK_STATS_PATH)
+    except OSError as e:
+        logger.warning(f"Could not persist task stats: {e}")
+
+# Per-task time budgets (seconds) so one slow upstream cannot stall the whole run
+BUDGETS = {
+    "discover_rss": 15,
+    "scrape_url_advanced": 20,
+    "search_web": 15,
+    "search_youtube": 10,
+    "comprehensive_discovery": 30
+}
+DEFAULT_BUDGET = 30
+
+async def run_with_budget(run, task):
+    """Run task through run(task), giving up once its type's time budget is spent"""
+    budget = BUDGETS.get(task.data.get("type"), DEFAULT_BUDGET)
+    async with timed(task, TASK_STATS):
+        try:
+            return await asyncio.wait_for(run(task), timeout=budget)
+        except asyncio.TimeoutError:
+            return {"status": "timeout", "message": f"Task exceeded its {budget}s budget"}
+
+# Report templates, filled with str.format_map from each result and REPORT_DEFAULTS
+RSS_REPORT = "[RESULT] RSS discovery: {status}\n  - Articles found: {new_articles}"
+SCRAPE_REPORT = "[RESULT] Advanced scraping: {status}"
+SCRAPE_DETAILS = "  - Scraper used: {scraper_used}\n  - Content length: {content_length}"
+SEARCH_REPORT = "[RESULT] Web search: {status}"
+SEARCH_DETAILS = (
+    "  - Search results found: {search_results_found}\n"
+    "  - Content extracted: {content_extracted}\n"
+    "  - Sources used: {search_sources_used}"
+)
+YOUTUBE_REPORT = "[RESULT] YouTube search: {status}"
+YOUTUBE_DETAILS = "  - Videos found: {videos_found}\n  - Channels discovered: {channels_discovered}"
+YOUTUBE_ERROR = "  - Expected error (no API keys): {message}"
+COMPREHENSIVE_REPORT = "[RESULT] Comprehensive discovery: {status}"
+COMPREHENSIVE_DETAILS = (
+    "  - Total content found: {total_content_found}\n"
+    "  - Discovery methods used: {discovery_methods}\n"
+    "  - Errors: {error_count}"
+)
+CONTENT_REPORT = "[RESULT] Enhanced content retrieval: {status}"
+CONTENT_DETAILS = (
+    "  - Total available: {total_available}\n"
+    "  - Filtered count: {filtered_count}\n"
+    "  - Returned count: {returned_count}\n"
+    "  - Content types: {content_types}"
+)
+SAMPLE_ITEM = (
+    "  {index}. {title:.50}...\n"
+    "     Type: {content_type}\n"
+    "     Source: {source}\n"
+    "     Relevance: {relevance_score:.2f}"
+)
+
+REPORT_DEFAULTS = MappingProxyType({
+    "status": "unknown",
+    "message": "Unknown error",
+    "new_articles": 0,
+    "scraper_used": "unknown",
+    "content_length": 0,
+    "search_results_found": 0,
+    "content_extracted": 0,
+    "search_sources_used": [],
+    "videos_found": 0,
+    "channels_discovered": [],
+    "total_content_found": 0,
+    "discovery_methods": [],
+    "total_available": 0,
+    "filtered_count": 0,
+    "returned_count": 0,
+    "title": "No title",
+    "content_type": "unknown",
+    "source": "unknown",
+    "relevance_score": 0.0
+})
+
+def render(template, *results):
+    """Fill a report template from result mappings, earliest first, then REPORT_DEFAULTS"""
+    return template.format_map(ChainMap(*results, REPORT_DEFAULTS))
+
+# Final verdicts are built once at import rather than on the exit path
+SUCCESS_MARK = ("\n[SUCCESS] Enhanced Scout Agent test completed successfully!\n"
+                "All advanced features are working correctly.")
+FAILURE_MARK = ("\n[INFO] Enhanced Scout Agent test completed - check results above\n"
+                "Some features may require additional dependencies or API keys.")
+
+def needs_keys(*names):
+    """Return the environment variables from names that are not set"""
+    return [name for name in names if not os.getenv(name)]
+
+@functools.lru_cache(maxsize=None)
+def has_module(name):
+    """Locate a module without executing it; memoized across dependency checks"""
+    return importlib.util.find_spec(name) is not None
+
+# Scouts kept alive between test runs, keyed by a checksum of their config
+_scout_cache = {}
+
+def get_scout(agent_id, config):
+    """Return a cached EnhancedScoutAgent for this config, creating it on first use"""
+    from enhanced_agent import EnhancedScoutAgent
+    
+    checksum_fields = {k: v for k, v in config.items() if k != "http_client"}
+    key = hashlib.md5(json.dumps(checksum_fields, sort_keys=True).encode("utf-8")).hexdigest()
+    if key not in _scout_cache:
+        _scout_cache[key] = EnhancedScoutAgent(agent_id, dict(config))
+    return _scout_cache[key]
+
+async def close_scouts():
+    """Clean up every cached scout (closes their HTTP sessions)"""
+    while _scout_cache:
+        _, scout = _scout_cache.popitem()
+        await scout.cleanup()
+    emit("\n[OK] Enhanced Scout cleanup completed")
+    await flush_output()
+
+def create_shared_client():
+    """Build the HTTP client shared by every scout; its pool bounds aggregate concurrency"""
+    from agent import DEFAULT_HEADERS
+    
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        timeout=httpx.Timeout(30.0, pool=HTTP_POOL_TIMEOUT),
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=MAX_HTTP_CONNECTIONS,
+            max_keepalive_connections=MAX_HTTP_CONNECTIONS
+        )
+    )
+
+async def test_enhanced_scout_agent(http_client=None):
     """Test Enhanced Scout Agent with all advanced features"""
-    print("Testing Enhanced Scout Agent...")
+    emit("Testing Enhanced Scout Agent...")
     
     try:
-        from enhanced_agent import EnhancedScoutAgent
-        
-        # Configuration for testing
-        config = {
-            # Basic RSS config
-            "rss_feeds": [
-                "https://www.archdaily.com/rss/",
-                "https://feeds.feedburner.com/TEDTalks_video"
-            ],
-            "scraping_interval": 30,
-            "max_concurrent_scrapes": 2,
-            "max_articles_per_source": 2,
-            "rate_limit_delay": 2.0,
-            
-            # Enhanced features config
-            "enable_advanced_scraping": True,
-            "enable_search": True,
-            "enable_youtube": True,
-            
-            # Search configuration (no API keys for testing)
-            "web_search_limit": 5,
-            "youtube_search_limit": 3,
-            
-            # Advanced scraper config
-            "use_scrapling": True,
-            "scraper_max_retries": 2,
-            "scraper_retry_delay": 3.0,
-            "scraper_timeout": 20.0,
-            
-            # Search queries
-            "search_queries": [
-                "AI construction 2024",
-                "BIM artificial intelligence"
-            ],
-            "youtube_search_queries": [
-                "AI construction",
-                "BIM artificial intelligence"
-            ]
-        }
-        
-        scout = EnhancedScoutAgent("test-enhanced-scout", config)
-        print("[OK] Enhanced Scout Agent created")
-        
-        # Import architecture for task creation
-        import importlib.util
-        arch_path = os.path.join(os.path.dirname(__file__), 'multi-agent-architecture.py')
-        spec = importlib.util.spec_from_file_location("multi_agent_architecture", arch_path)
-        arch_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(arch_module)
+        scout = get_scout("test-enhanced-scout", dict(CONFIG, http_client=http_client))
+        emit("[OK] Enhanced Scout Agent created")
         
+        await flush_output()
         # Test 1: Enhanced health check
-        print("\n=== Test 1: Enhanced Health Check ===")
+        emit("\n=== Test 1: Enhanced Health Check ===")
         health_ok = await scout.health_check()
-        print(f"[RESULT] Enhanced health check: {'PASS' if health_ok else 'FAIL'}")
+        emit(f"[RESULT] Enhanced health check: {'PASS' if health_ok else 'FAIL'}")
         
-        # Test 2: Basic RSS discovery (inherited functionality)
-        print("\n=== Test 2: RSS Discovery ===")
-        rss_task = arch_module.AgentTask(
-            task_id="rss-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "discover_rss",
-                "feeds": config["rss_feeds"]
-            },
-            created_at=arch_module.datetime.now()
-        )
+        # Tests 2-5 are independent, so build their tasks and run them concurrently
+        now = arch_module.datetime.now()
         
-        rss_result = await scout.process_task(rss_task)
-        print(f"[RESULT] RSS discovery: {rss_result.get('status', 'unknown')}")
-        print(f"  - Articles found: {rss_result.get('new_articles', 0)}")
+        # Test 2: Basic RSS discovery (inherited functionality)
+        rss_task = make_task("rss-test", RSS_DATA, now)
         
         # Test 3: Advanced URL scraping
-        print("\n=== Test 3: Advanced URL Scraping ===")
-        scrape_task = arch_module.AgentTask(
-            task_id="scrape-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "scrape_url_advanced",
-                "url": "https://httpbin.org/html"  # Safe test URL
-            },
-            created_at=arch_module.datetime.now()
-        )
-        
-        scrape_result = await scout.process_task(scrape_task)
-        print(f"[RESULT] Advanced scraping: {scrape_result.get('status', 'unknown')}")
-        if scrape_result.get('status') == 'success':
-            print(f"  - Scraper used: {scrape_result.get('scraper_used', 'unknown')}")
-            print(f"  - Content length: {scrape_result.get('content_length', 0)}")
+        scrape_task = make_task("scrape-test", SCRAPE_DATA, now)
         
         # Test 4: Web search (if no API keys, will use DuckDuckGo fallback)
-        print("\n=== Test 4: Web Search ===")
-        search_task = arch_module.AgentTask(
-            task_id="search-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "search_web",
-                "query": "AI construction industry",
-                "max_results": 3
-            },
-            created_at=arch_module.datetime.now()
-        )
+        search_task = make_task("search-test", SEARCH_DATA, now)
         
-        search_result = await scout.process_task(search_task)
-        print(f"[RESULT] Web search: {search_result.get('status', 'unknown')}")
-        if search_result.get('status') == 'success':
-            print(f"  - Search results found: {search_result.get('search_results_found', 0)}")
-            print(f"  - Content extracted: {search_result.get('content_extracted', 0)}")
-            print(f"  - Sources used: {search_result.get('search_sources_used', [])}")
+        # Test 5: YouTube search, skipped up front when the Klavis key is missing
+        youtube_missing = needs_keys("KLAVIS_API_KEY")
+        pending = [
+            run_with_budget(scout.process_task, rss_task),
+            run_with_budget(scout.process_task, scrape_task),
+            run_with_budget(scout.process_task, search_task)
+        ]
+        if not youtube_missing:
+            youtube_task = make_task("youtube-test", YOUTUBE_DATA, now)
+            pending.append(run_with_budget(scout.process_task, youtube_task))
         
-        # Test 5: YouTube search (will fail without API keys but should handle gracefully)
-        print("\n=== Test 5: YouTube Search ===")
-        youtube_task = arch_module.AgentTask(
-            task_id="youtube-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "search_youtube",
-                "max_videos": 2
-            },
-            created_at=arch_module.datetime.now()
-        )
+        results = await asyncio.gather(*pending)
+        rss_result, scrape_result, search_result = results[:3]
+        youtube_result = results[3] if len(results) > 3 else None
+        
+        await flush_output()
+        emit("\n=== Test 2: RSS Discovery ===")
+        emit(render(RSS_REPORT, rss_result))
         
-        youtube_result = await scout.process_task(youtube_task)
-        print(f"[RESULT] YouTube search: {youtube_result.get('status', 'unknown')}")
-        if youtube_result.get('status') == 'success':
-            print(f"  - Videos found: {youtube_result.get('videos_found', 0)}")
-            print(f"  - Channels discovered: {youtube_result.get('channels_discovered', [])}")
-        elif youtube_result.get('status') == 'error':
-            print(f"  - Expected error (no API keys): {youtube_result.get('message', 'Unknown error')}")
+        emit("\n=== Test 3: Advanced URL Scraping ===")
+        emit(render(SCRAPE_REPORT, scrape_result))
+        if scrape_result.get('status') == 'success':
+            emit(render(SCRAPE_DETAILS, scrape_result))
+        
+        emit("\n=== Test 4: Web Search ===")
+        emit(render(SEARCH_REPORT, search_result))
+        if search_result.get('status') == 'success':
+            emit(render(SEARCH_DETAILS, search_result))
+        for provider, keys in SEARCH_PROVIDER_KEYS.items():
+            missing = needs_keys(*keys)
+            if missing:
+                emit(f"  [SKIP] {provider} search (no {', '.join(missing)})")
         
+        emit("\n=== Test 5: YouTube Search ===")
+        if youtube_result is None:
+            emit(f"[SKIP] YouTube search (no {', '.join(youtube_missing)})")
+        else:
+            youtube_status = youtube_result.get('status')
+            emit(render(YOUTUBE_REPORT, youtube_result))
+            if youtube_status == 'success':
+                emit(render(YOUTUBE_DETAILS, youtube_result))
+            elif youtube_status == 'error':
+                emit(render(YOUTUBE_ERROR, youtube_result))
+        
+        await flush_output()
         # Test 6: Comprehensive discovery
-        print("\n=== Test 6: Comprehensive Discovery ===")
-        comprehensive_task = arch_module.AgentTask(
-            task_id="comprehensive-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "comprehensive_discovery",
-                "include_rss": True,
-                "include_search": True,
-                "include_youtube": False,  # Skip YouTube to avoid API errors
-                "search_queries": ["AI architecture design"]
-            },
-            created_at=arch_module.datetime.now()
-        )
+        emit("\n=== Test 6: Comprehensive Discovery ===")
+        now = arch_module.datetime.now()
+        comprehensive_task = make_task("comprehensive-test", COMPREHENSIVE_DATA, now)
         
-        comprehensive_result = await scout.process_task(comprehensive_task)
-        print(f"[RESULT] Comprehensive discovery: {comprehensive_result.get('status', 'unknown')}")
+        comprehensive_result = await run_with_budget(scout.process_task, comprehensive_task)
+        emit(render(COMPREHENSIVE_REPORT, comprehensive_result))
         if comprehensive_result.get('status') == 'success':
-            print(f"  - Total content found: {comprehensive_result.get('total_content_found', 0)}")
-            print(f"  - Discovery methods used: {comprehensive_result.get('discovery_methods', [])}")
-            print(f"  - Errors: {len(comprehensive_result.get('errors', []))}")
+            error_count = len(comprehensive_result.get('errors', []))
+            emit(render(COMPREHENSIVE_DETAILS, {"error_count": error_count}, comprehensive_result))
         
+        await flush_output()
         # Test 7: Get enhanced content
-        print("\n=== Test 7: Enhanced Content Retrieval ===")
-        content_task = arch_module.AgentTask(
-            task_id="content-test",
-            agent_type="scout",
-            priority=1,
-            data={
-                "type": "get_enhanced_content",
-                "max_items": 10,
-                "min_relevance": 0.0,
-                "include_youtube": False,
-                "include_search": True
-            },
-            created_at=arch_module.datetime.now()
-        )
+        emit("\n=== Test 7: Enhanced Content Retrieval ===")
+        now = arch_module.datetime.now()
+        content_task = make_task("content-test", CONTENT_DATA, now)
         
-        content_result = await scout.process_task(content_task)
-        print(f"[RESULT] Enhanced content retrieval: {content_result.get('status', 'unknown')}")
+        content_result = await run_with_budget(scout.process_task, content_task)
+        emit(render(CONTENT_REPORT, content_result))
         if content_result.get('status') == 'success':
-            print(f"  - Total available: {content_result.get('total_available', 0)}")
-            print(f"  - Filtered count: {content_result.get('filtered_count', 0)}")
-            print(f"  - Returned count: {content_result.get('returned_count', 0)}")
-            print(f"  - Content types: {list(content_result.get('content_by_type', {}).keys())}")
+            content_types = list(content_result.get('content_by_type', {}).keys())
+            emit(render(CONTENT_DETAILS, {"content_types": content_types}, content_result))
         
         # Show sample enhanced content
         all_content = content_result.get('all_content', [])
         if all_content:
-            print(f"\nSample enhanced content ({len(all_content)} items):")
+            emit(f"\nSample enhanced content ({len(all_content)} items):")
             for i, item in enumerate(all_content[:2]):
-                print(f"  {i+1}. {item.get('title', 'No title')[:50]}...")
-                print(f"     Type: {item.get('content_type', 'unknown')}")
-                print(f"     Source: {item.get('source', 'unknown')}")
-                print(f"     Relevance: {item.get('relevance_score', 0.0):.2f}")
-        
-        # Cleanup
-        await scout.cleanup()
-        print("\n[OK] Enhanced Scout cleanup completed")
+                emit(render(SAMPLE_ITEM, {"index": i + 1}, item))
         
         return True
         
     except Exception as e:
-        print(f"[FAIL] Enhanced Scout test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        emit(f"[FAIL] Enhanced Scout test failed: {e}")
+        logger.exception("Enhanced Scout test failed")
         return False
+    finally:
+        report_task_stats(TASK_STATS)
+        await flush_output()
 
 async def test_dependencies():
     """Test optional dependencies"""
-    print("\n=== Testing Dependencies ===")
+    emit("\n=== Testing Dependencies ===")
     
-    # Test Scrapling
-    try:
-        from scrapling import Adapter
-        print("[OK] Scrapling available")
-    except ImportError:
-        print("[INFO] Scrapling not available - install with: pip install scrapling")
+    dependencies = [
+        ("scrapling", "Scrapling", "[INFO]", "scrapling"),
+        ("klavis", "Klavis", "[INFO]", "klavis"),
+        ("anthropic", "Anthropic", "[INFO]", "anthropic"),
+        ("httpx", "httpx", "[WARN]", "httpx"),
+        ("bs4", "BeautifulSoup", "[WARN]", "beautifulsoup4")
+    ]
     
-    # Test Klavis
-    try:
-        from klavis import Klavis
-        print("[OK] Klavis available")
-    except ImportError:
-        print("[INFO] Klavis not available - install with: pip install klavis")
+    # Probe concurrently; find_spec mostly waits on filesystem lookups
+    loop = asyncio.get_event_loop()
+    available = await asyncio.gather(
+        *(loop.run_in_executor(None, has_module, module) for module, _, _, _ in dependencies)
+    )
     
-    # Test Anthropic
-    try:
-        from anthropic import Anthropic
-        print("[OK] Anthropic available")
-    except ImportError:
-        print("[INFO] Anthropic not available - install with: pip install anthropic")
-    
-    # Test httpx and BeautifulSoup
-    try:
-        import httpx
-        print("[OK] httpx available")
-    except ImportError:
-        print("[WARN] httpx not available - install with: pip install httpx")
+    for (module, label, level, package), found in zip(dependencies, available):
+        if found:
+            emit(f"[OK] {label} available")
+        else:
+            emit(f"{level} {label} not available - install with: pip install {package}")
     
-    try:
-        from bs4 import BeautifulSoup
-        print("[OK] BeautifulSoup available")
-    except ImportError:
-        print("[WARN] BeautifulSoup not available - install with: pip install beautifulsoup4")
+    await flush_output()
 
 def show_requirements():
     """Show requirements for full functionality"""
@@ -277,23 +480,27 @@ def show_requirements():
     print("  - KLAVIS_API_KEY for YouTube integration")
     print("  - ANTHROPIC_API_KEY for content analysis")
 
+async def main():
+    """Run the dependency probe and the scout test in one event loop"""
+    # Test dependencies first
+    await test_dependencies()
+    
+    # Run main test
+    http_client = create_shared_client()
+    try:
+        return await test_enhanced_scout_agent(http_client)
+    finally:
+        await close_scouts()
+        await http_client.aclose()
+
 if __name__ == "__main__":
     print("=" * 70)
     print("AEC AI News - Enhanced Scout Agent Test")
     print("=" * 70)
     
-    # Test dependencies first
-    asyncio.run(test_dependencies())
-    
-    # Run main test
-    success = asyncio.run(test_enhanced_scout_agent())
+    success = asyncio.run(main())
     
-    if success:
-        print("\n[SUCCESS] Enhanced Scout Agent test completed successfully!")
-        print("All advanced features are working correctly.")
-    else:
-        print("\n[INFO] Enhanced Scout Agent test completed - check results above")
-        print("Some features may require additional dependencies or API keys.")
+    print(SUCCESS_MARK if success else FAILURE_MARK)
     
     # Show requirements
     show_requirements()